@@ -1,6 +1,13 @@
+import atexit
+import contextlib
+import functools
 import logging
+import queue
+import re
 import sys
+import threading
 import traceback
+from logging.handlers import QueueHandler, QueueListener
 
 # --- Rich Console (optional) ---
 _rich_console = None
@@ -8,6 +15,8 @@ _rich_console = None
 def set_rich_console(console):
     """Set rich console for proper output when Live display is active."""
     global _rich_console
+    # Drain queued records so they are not written underneath the Live display.
+    flush_logs()
     _rich_console = console
 
 def clear_rich_console():
@@ -45,18 +54,26 @@ class _TerminalColorMeta(type):
 
 
 class TerminalColor(metaclass=_TerminalColorMeta):
-    RED = ("red", "\033[91m")
-    GREEN = ("green", "\033[92m")
-    YELLOW = ("yellow", "\033[93m")
-    BLUE = ("blue", "\033[94m")
-    MAGENTA = ("magenta", "\033[95m")
-    CYAN = ("cyan", "\033[96m")
-    WHITE = ("white", "\033[97m")
-    RESET = ("reset", "\033[0m")
+    # ANSI codes are interned so every log record shares one string object.
+    RED = ("red", sys.intern("\033[91m"))
+    GREEN = ("green", sys.intern("\033[92m"))
+    YELLOW = ("yellow", sys.intern("\033[93m"))
+    BLUE = ("blue", sys.intern("\033[94m"))
+    MAGENTA = ("magenta", sys.intern("\033[95m"))
+    CYAN = ("cyan", sys.intern("\033[96m"))
+    WHITE = ("white", sys.intern("\033[97m"))
+    RESET = ("reset", sys.intern("\033[0m"))
 
 # --- Log Level Configuration ---
 _log_level = logging.INFO
 _show_traceback = False
+# Cached level checks so suppressed helpers return before calling print_base.
+# DEBUG_ENABLED and INFO_ENABLED are public: read them as _utils.DEBUG_ENABLED
+# (not a from-import, which would freeze the value) to skip building expensive
+# debug or info/confirm messages.
+DEBUG_ENABLED = False
+INFO_ENABLED = True
+_WARN_ON = True
 
 
 def set_log_level(level, show_traceback=False):
@@ -67,95 +84,420 @@ def set_log_level(level, show_traceback=False):
         level (str or int): The desired log level, e.g., 'DEBUG', 'INFO', logging.DEBUG.
         show_traceback (bool): If True, print_error will include a traceback.
     """
-    global _log_level, _show_traceback
+    global _log_level, _show_traceback, DEBUG_ENABLED, INFO_ENABLED, _WARN_ON
     if isinstance(level, str):
         _log_level = getattr(logging, level.upper(), logging.INFO)
     else:
         _log_level = level
     _show_traceback = show_traceback
+    _configure_once()
+    _logger.setLevel(_log_level)
+    DEBUG_ENABLED = _log_level <= logging.DEBUG
+    INFO_ENABLED = _log_level <= logging.INFO
+    _WARN_ON = _log_level <= logging.WARNING
 
 
 # --- Logger Setup ---
-# Using a basic configuration. A more advanced setup could use handlers.
-logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+class _ColorFormatter(logging.Formatter):
+    """Joins the precomputed head (color + tag) and tail (reset) extras of a
+    record around its message.
+
+    Coloring happens at emit time, so records dropped by the logger level are
+    never wrapped.
+    """
+
+    def format(self, record):
+        return "".join(
+            (
+                getattr(record, "head", ""),
+                super().format(record),
+                getattr(record, "tail", ""),
+            )
+        )
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that only flushes for WARNING and above.
+
+    Debug/info records stay in the stream's buffer instead of forcing a flush
+    syscall per line when stdout is a pipe or file; warnings and errors are
+    still written out immediately. flush_logs() and logging's shutdown hook
+    flush whatever is left.
+    """
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _make_extra(color, prefix=""):
+    """Build the record extras for a color tuple and tag prefix."""
+    if not color:
+        return {"head": sys.intern(prefix), "tail": ""}
+    return {"head": sys.intern(color[1] + prefix), "tail": TerminalColor.RESET[1]}
+
+
+# Extras of the public helpers, built once instead of on every call.
+_INFO_EXTRA = _make_extra(TerminalColor.GREEN)
+_WARN_PREFIX = sys.intern("[WARN] ")
+_DEBUG_PREFIX = sys.intern("[DEBG] ")
+_ERROR_PREFIX = sys.intern("[ERRO] ")
+_WARN_EXTRA = _make_extra(TerminalColor.YELLOW, _WARN_PREFIX)
+_DEBUG_EXTRA = _make_extra(TerminalColor.BLUE, _DEBUG_PREFIX)
+_ERROR_EXTRA = _make_extra(TerminalColor.RED, _ERROR_PREFIX)
+_CONFIRM_EXTRA = _make_extra(TerminalColor.MAGENTA)
+
+
+# Handlers are installed on first use rather than at import, so importing this
+# module has no side effects and callers can set up logging themselves first.
 _logger = logging.getLogger("mujoco_converter")
+_logger.setLevel(_log_level)
+_logger.propagate = False
+_configured = False
+_handler = None
+_listener = None
+_log_queue = None
+# True while the queue listener thread is running (see enable_log_queue)
+_log_queue_active = False
+
+
+def _configure_once():
+    """Attach the stdout handler to the converter logger, once."""
+    global _configured, _handler
+    if _configured:
+        return
+    _configured = True
+    _handler = _BufferedStreamHandler(sys.stdout)
+    _handler.setFormatter(_ColorFormatter("%(message)s"))
+    _logger.addHandler(_handler)
+
+
+def enable_log_queue():
+    """Hand records to a background listener thread through a queue.
+
+    Opt-in for long-running conversions, so the conversion loop never blocks
+    on stdout writes. Call flush_logs() before output that must appear after
+    every pending record.
+    """
+    global _listener, _log_queue, _log_queue_active
+    _configure_once()
+    if _listener is not None:
+        return
+    # queue.Queue rather than SimpleQueue: the listener marks each record
+    # task_done(), which lets flush_logs() join() the queue
+    _log_queue = queue.Queue()
+    _listener = QueueListener(_log_queue, _handler, respect_handler_level=True)
+    _queue_handler = QueueHandler(_log_queue)
+    _logger.removeHandler(_handler)
+    _logger.addHandler(_queue_handler)
+    _listener.start()
+    _log_queue_active = True
+
+    def _stop_log_queue():
+        """Drain and stop the listener; later records go straight to stdout."""
+        global _log_queue_active
+        _log_queue_active = False
+        _logger.removeHandler(_queue_handler)
+        _logger.addHandler(_handler)
+        _listener.stop()
+
+    atexit.register(_stop_log_queue)
+
+
+def flush_logs():
+    """Block until every pending log record has been written and flushed.
+
+    Call before output that bypasses the logger (tracebacks on stderr, rich
+    Live displays) or before replacing the process with os.exec*.
+    """
+    if _log_queue_active:
+        _log_queue.join()
+    if _handler is not None:
+        _handler.flush()
+
+
+# --- Batched Output ---
+# Per-thread list of pending (message, color, prefix) lines while log_batch()
+# is active, None otherwise.
+_batch_state = threading.local()
+
+
+@contextlib.contextmanager
+def log_batch():
+    """Collect the calling thread's debug/info/confirm lines and write them as one block.
+
+    Meant for per-item work such as one link's meshes: the lines come out
+    together in a single write (or a single rich print while a Live display
+    is active) instead of one write per line, and lines of parallel workers
+    do not interleave. Warnings and errors are still printed immediately,
+    right after the lines collected so far, so they keep their context.
+    Nested batches join the outermost one.
+    """
+    if getattr(_batch_state, "lines", None) is not None:
+        yield
+        return
+    lines = _batch_state.lines = []
+    try:
+        yield
+    finally:
+        _batch_state.lines = None
+        if lines:
+            _write_batch(lines)
+
+
+# --- Captured Output ---
+# Per-thread list of pending (level, message, color, prefix) records while
+# capture_logs() is active, None otherwise.
+_capture_state = threading.local()
+
+
+@contextlib.contextmanager
+def capture_logs():
+    """Collect the calling thread's log records instead of printing them.
+
+    For worker processes, which have no console of their own: the records
+    are sent back to the parent and printed there with replay_logs(), so
+    they go through the parent's console, log batch and Live display.
+    Messages are still filtered by this process's log level first.
+    """
+    records = _capture_state.records = []
+    try:
+        yield records
+    finally:
+        _capture_state.records = None
+
+
+def replay_logs(records):
+    """Print records collected by capture_logs(), possibly in another process."""
+    for level, message, color, prefix in records:
+        print_base(message, level, color, prefix=prefix)
+
+
+def _write_batch(lines):
+    """Write the lines collected by log_batch() in one go."""
+    if _rich_console:
+        _rich_console.print(
+            "\n".join(
+                f"[{color[0]}]{prefix}{message}[/{color[0]}]" if color else f"{prefix}{message}"
+                for message, color, prefix in lines
+            )
+        )
+        return
+    if not _configured:
+        _configure_once()
+    reset = TerminalColor.RESET[1]
+    text = "\n".join(
+        f"{color[1]}{prefix}{message}{reset}" if color else f"{prefix}{message}"
+        for message, color, prefix in lines
+    )
+    _logger.log(logging.INFO, "%s", text, extra={"head": "", "tail": ""})
 
 
 # --- Public Print Functions ---
-def print_base(message, level=logging.INFO, color=None):
+def print_base(
+    message, level=logging.INFO, color=None, args=(), prefix="", extra=None
+):
     """Internal logging function that respects rich console.
-    
+
+    Formatting is deferred until after the level check, so suppressed messages
+    cost neither the %-substitution nor the prefix/color wrapping. On plain
+    stdout both are left to the logging handler.
+
     Args:
-        message: The message to print
+        message: The message to print, optionally a %-style template
         level: Logging level
         color: Tuple of (color_label, ansi_code) from TerminalColor class, or None
+        args: Arguments substituted into message with the % operator
+        prefix: Tag prepended to the message, e.g. "[WARN] "
+        extra: Precomputed _make_extra(color, prefix) result, if available
     """
-    if level >= _log_level:
-        # If rich console is set, use it with rich markup for colors
-        if _rich_console:
-            if color:
-                color_label, _ = color  # Extract label from tuple
-                _rich_console.print(f"[{color_label}]{message}[/{color_label}]")
-            else:
-                _rich_console.print(message)
+    lvl = _log_level
+    if level < lvl:
+        return
+    records = getattr(_capture_state, "records", None)
+    if records is not None:
+        records.append((level, message % args if args else message, color, prefix))
+        return
+    batch = getattr(_batch_state, "lines", None)
+    if batch is not None:
+        if level < logging.WARNING:
+            batch.append((message % args if args else message, color, prefix))
+            return
+        if batch:
+            # Write what came before the warning first, keeping the order
+            _write_batch(batch)
+            batch.clear()
+    # If rich console is set, use it with rich markup for colors
+    if _rich_console:
+        if args:
+            message = message % args
+        if color:
+            color_label, _ = color  # Extract label from tuple
+            _rich_console.print(f"[{color_label}]{prefix}{message}[/{color_label}]")
         else:
-            # Use ANSI color codes for normal stdout
-            if color:
-                _, ansi_code = color  # Extract ANSI code from tuple
-                reset_code = TerminalColor.RESET[1]
-                formatted_message = f"{ansi_code}{message}{reset_code}"
-            else:
-                formatted_message = message
-            _logger.log(level, formatted_message)
+            _rich_console.print(f"{prefix}{message}")
+    else:
+        # Plain stdout: logging substitutes args and _ColorFormatter applies
+        # the ANSI color code and prefix when the record is emitted.
+        if not _configured:
+            _configure_once()
+        if extra is None:
+            extra = _make_extra(color, prefix)
+        _logger.log(level, message, *args, extra=extra)
 
 
-def print_info(message):
+def print_info(message, *args):
     """Prints an informational message in green."""
-    print_base(message, logging.INFO, TerminalColor.GREEN)
-
-
-def print_warning(message):
+    if not INFO_ENABLED:
+        return
+    print_base(
+        message,
+        logging.INFO,
+        TerminalColor.GREEN,
+        args,
+        extra=_INFO_EXTRA,
+    )
+
+
+def print_warning(message, *args):
     """Prints a warning message in yellow."""
-    print_base(f"[WARN] {message}", logging.WARNING, TerminalColor.YELLOW)
-
-
-def print_debug(message):
-    """Prints a debug message in blue."""
-    print_base(f"[DEBG] {message}", logging.DEBUG, TerminalColor.BLUE)
-
-
-def print_error(message, exc_info=None):
+    if not _WARN_ON:
+        return
+    print_base(
+        message,
+        logging.WARNING,
+        TerminalColor.YELLOW,
+        args,
+        _WARN_PREFIX,
+        extra=_WARN_EXTRA,
+    )
+
+
+def print_debug(message, *args):
+    """Prints a debug message in blue.
+
+    Pass %-style arguments instead of an f-string in hot paths so nothing is
+    formatted while debug output is disabled. When computing the arguments is
+    itself expensive, guard the call with ``if _utils.DEBUG_ENABLED:``.
+    """
+    if not DEBUG_ENABLED:
+        return
+    print_base(
+        message,
+        logging.DEBUG,
+        TerminalColor.BLUE,
+        args,
+        _DEBUG_PREFIX,
+        extra=_DEBUG_EXTRA,
+    )
+
+
+def print_error(message, *args, exc_info=None):
     """
     Prints an error message in red.
 
     Args:
-        message (str): The error message to print.
+        message (str): The error message to print, optionally a %-style template.
+        *args: Arguments substituted into message.
         exc_info (bool or Exception, optional): If True, prints the current exception's traceback.
                                                 If an Exception object is passed, its traceback is printed.
                                                 Defaults to None.
     """
-    print_base(f"[ERRO] {message}", logging.ERROR, TerminalColor.RED)
+    print_base(
+        message,
+        logging.ERROR,
+        TerminalColor.RED,
+        args,
+        _ERROR_PREFIX,
+        extra=_ERROR_EXTRA,
+    )
 
     # Determine if a traceback should be shown.
     # This can be triggered by the global flag or by passing exc_info.
     should_show_traceback = _show_traceback or exc_info
 
     if should_show_traceback:
+        flush_logs()
         if isinstance(exc_info, BaseException):
             # If an exception object was passed, format and print it.
             tb_lines = traceback.format_exception(
                 type(exc_info), exc_info, exc_info.__traceback__
             )
             sys.stderr.write("".join(tb_lines))
-        else:
+        elif sys.exc_info()[0] is not None:
             # Otherwise, use the current system exception info.
-            # This works inside an 'except' block.
+            # This works inside an 'except' block; outside one there is
+            # nothing to print.
             traceback.print_exc(file=sys.stderr)
 
 
-def print_confirm(message):
+def print_confirm(message, *args):
     """Prints a confirmation message in magenta."""
-    print_base(message, logging.INFO, TerminalColor.MAGENTA)
+    if not INFO_ENABLED:
+        return
+    print_base(
+        message,
+        logging.INFO,
+        TerminalColor.MAGENTA,
+        args,
+        extra=_CONFIRM_EXTRA,
+    )
+
+
+# --- Actuator Gain Parsing ---
+_ALLOWED_GAIN_KEYS = frozenset(("kp", "kv", "dampratio"))
+# One "key=value" pair plus any leading comma/whitespace separators; whitespace
+# may surround the '='. Consecutive matches must abut, or something between
+# them failed to parse.
+_GAIN_PAIR_RE = re.compile(r"[,\s]*([^=,\s]+)\s*=\s*([^,\s]+)")
+_GAIN_SEPARATORS_RE = re.compile(r"[,\s]*")
+_GAIN_SEPARATOR_RE = re.compile(r"[,\s]")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_gains_string(value):
+    """Parse a gains string into a tuple of (key, value) pairs.
+
+    Cached because the same few strings (the CLI default, config values) are
+    parsed repeatedly; the immutable result is expanded into a fresh dict by
+    parse_actuator_gains so callers can still mutate what they get back.
+    """
+    result = {}
+    pos = 0
+    # Single pass: validate contiguity and convert each pair as it is found.
+    for match in _GAIN_PAIR_RE.finditer(value):
+        if match.start() != pos:
+            break
+        pos = match.end()
+        key, val = match.groups()
+        if key not in _ALLOWED_GAIN_KEYS:
+            raise ValueError(
+                f"Unknown actuator gain key: '{key}'. Allowed keys: kp, kv, dampratio"
+            )
+
+        try:
+            result[key] = float(val)
+        except ValueError:
+            raise ValueError(f"Invalid value for '{key}': '{val}'. Must be a number.")
+
+    # Anything left after the last pair other than separators is malformed.
+    tail = _GAIN_SEPARATORS_RE.match(value, pos).end()
+    if tail != len(value):
+        bad_pair = _GAIN_SEPARATOR_RE.split(value[tail:], 1)[0]
+        raise ValueError(
+            f"Invalid format: '{bad_pair}'. Expected format: key=value (e.g., 'kp=500.0,kv=1.0')"
+        )
+
+    if not result:
+        raise ValueError(f"No valid key=value pairs found in: '{value}'")
+
+    return tuple(result.items())
 
 
 def parse_actuator_gains(value):
@@ -190,44 +532,4 @@ def parse_actuator_gains(value):
                 f"Legacy list format must have exactly 2 values [kp, kv], got {len(value)}"
             )
 
-    result = {}
-    # Try comma-separated first, then space-separated
-    separators = [",", " "]
-    pairs = []
-
-    for sep in separators:
-        if sep in value:
-            pairs = value.split(sep)
-            break
-
-    if not pairs:
-        pairs = [value]
-
-    for pair in pairs:
-        pair = pair.strip()
-        if not pair:
-            continue
-
-        if "=" not in pair:
-            raise ValueError(
-                f"Invalid format: '{pair}'. Expected format: key=value (e.g., 'kp=500.0,kv=1.0')"
-            )
-
-        key, val = pair.split("=", 1)
-        key = key.strip()
-        val = val.strip()
-
-        if key not in ["kp", "kv", "dampratio"]:
-            raise ValueError(
-                f"Unknown actuator gain key: '{key}'. Allowed keys: kp, kv, dampratio"
-            )
-
-        try:
-            result[key] = float(val)
-        except ValueError:
-            raise ValueError(f"Invalid value for '{key}': '{val}'. Must be a number.")
-
-    if not result:
-        raise ValueError(f"No valid key=value pairs found in: '{value}'")
-
-    return result
+    return dict(_parse_gains_string(value))
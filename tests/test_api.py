@@ -1,4 +1,5 @@
 import json
+import os
 from argparse import Namespace
 
 import pytest
@@ -67,6 +68,18 @@ def test_json_input_is_auto_detected_as_config(tmp_path):
     assert args.config_file == str(config_path)
 
 
+def test_edited_config_is_reloaded(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"input": "robot.xacro"}))
+    assert build_conversion_args(config_path).input == "robot.xacro"
+
+    config_path.write_text(json.dumps({"input": "other_robot.urdf"}))
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert build_conversion_args(config_path).input == "other_robot.urdf"
+
+
 def test_unknown_inline_option_is_rejected():
     with pytest.raises(TypeError, match="Unknown conversion option"):
         build_conversion_args("robot.urdf", does_not_exist=True)
@@ -90,3 +103,26 @@ def test_convert_calls_converter_with_resolved_args(monkeypatch):
 
     assert result == "/tmp/robot/robot.xml"
     assert received["args"].add_floor is True
+
+
+def test_plain_xacro_file_skips_xacro_with_default_args(tmp_path, monkeypatch):
+    input_path = tmp_path / "robot.urdf.xacro"
+    input_path.write_text(
+        '<robot name="robot"><link name="base"><inertial><mass value="1"/>'
+        '<inertia ixx="1" iyy="1" izz="1" ixy="0" ixz="0" iyz="0"/>'
+        "</inertial></link></robot>"
+    )
+    xacro_lookups = []
+
+    def fake_xacro_path():
+        xacro_lookups.append(True)
+        return None
+
+    monkeypatch.setattr("urdf2mjcf.converter._xacro_path", fake_xacro_path)
+
+    args = build_conversion_args(input_path, output=tmp_path / "out")
+    assert args.xacro_args  # the CLI defaults are in effect
+    result = convert(input_path, output=tmp_path / "out")
+
+    assert xacro_lookups == []
+    assert result and os.path.exists(result)
@@ -0,0 +1,38 @@
+import json
+
+import trimesh
+
+from urdf2mjcf import mesh_ops
+
+
+def _copy_box(tmp_path):
+    src = tmp_path / "src" / "box.stl"
+    src.parent.mkdir()
+    trimesh.creation.box().export(src)
+    out = tmp_path / "out"
+    mesh_ops.copy_mesh_files(
+        {"base": {"visual": {"from": str(src), "to": "box.stl"}}},
+        str(out),
+        simplify_meshes=True,
+        simplify_params={"target_faces": 4},
+        max_workers=1,
+    )
+    cache_path = next(out.rglob(mesh_ops._MESH_CACHE_NAME))
+    return json.loads(cache_path.read_text())
+
+
+def test_failed_simplification_is_not_recorded(tmp_path, monkeypatch):
+    def _fail(*args):
+        raise RuntimeError("simplify failed")
+
+    monkeypatch.setattr(mesh_ops, "SIMPLIFY_MESH_TOOL_AVAILABLE", True)
+    monkeypatch.setattr(mesh_ops, "_simplify_with_tool", _fail)
+
+    assert "box.stl" not in _copy_box(tmp_path)
+
+
+def test_finished_mesh_is_recorded(tmp_path, monkeypatch):
+    monkeypatch.setattr(mesh_ops, "SIMPLIFY_MESH_TOOL_AVAILABLE", True)
+    monkeypatch.setattr(mesh_ops, "_simplify_with_tool", lambda *args: (12, 4))
+
+    assert "box.stl" in _copy_box(tmp_path)
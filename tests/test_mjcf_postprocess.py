@@ -3,6 +3,7 @@ import xml.etree.ElementTree as ET
 from urdf2mjcf.mjcf_postprocess import (
     post_process_add_actuators,
     post_process_add_mimic_equalities,
+    post_process_joint_and_body_attributes,
     post_process_make_base_floating,
     post_process_set_base_height,
     post_process_set_default_joint_properties,
@@ -40,6 +41,35 @@ def test_set_default_joint_properties_preserves_existing_attributes():
     assert joint.attrib == {"armature": "0.2", "damping": "1.0"}
 
 
+def test_joint_and_body_attributes_use_per_tweak_scopes():
+    root = ET.fromstring(
+        """
+        <mujoco>
+          <default><joint damping="1" /></default>
+          <worldbody>
+            <body name="base">
+              <joint name="j1" damping="2" />
+              <body name="child"><joint name="j2" /></body>
+            </body>
+          </worldbody>
+        </mujoco>
+        """
+    )
+
+    post_process_joint_and_body_attributes(
+        root, damping_multiplier=2.0, armature=0.1, gravity_compensation=True
+    )
+
+    assert root.find("./default/joint").attrib == {"damping": "2.0"}
+    assert root.find(".//joint[@name='j1']").attrib == {
+        "name": "j1",
+        "damping": "4.0",
+        "armature": "0.1",
+    }
+    assert root.find(".//joint[@name='j2']").get("armature") == "0.1"
+    assert [body.get("gravcomp") for body in root.iter("body")] == ["1", "1"]
+
+
 def test_add_mimic_equalities_uses_urdf_multiplier_and_offset():
     root = ET.fromstring(
         """
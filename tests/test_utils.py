@@ -1,6 +1,7 @@
 """
 Tests for utility functions in _utils.py
 """
+import logging
 import pytest
 import sys
 import os
@@ -8,7 +9,8 @@ import os
 # Add parent directory to path to import _utils
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from _utils import parse_actuator_gains
+import _utils
+from _utils import parse_actuator_gains, print_debug, print_error, set_log_level
 
 
 class TestParseActuatorGains:
@@ -66,11 +68,24 @@ class TestParseActuatorGains:
         result = parse_actuator_gains('kp=5e2,kv=1e0')
         assert result == {'kp': 500.0, 'kv': 1.0}
     
+    def test_underscore_digits(self):
+        """Test that anything float() accepts, like digit separators, is accepted"""
+        result = parse_actuator_gains('kp=1_000,kv=1.5')
+        assert result == {'kp': 1000.0, 'kv': 1.5}
+    
     def test_negative_values(self):
         """Test negative values (should work even if not typical)"""
         result = parse_actuator_gains('kp=-500.0,kv=-1.0')
         assert result == {'kp': -500.0, 'kv': -1.0}
     
+    def test_repeated_string_returns_fresh_dict(self):
+        """Test that cached parses still hand out independent dicts"""
+        first = parse_actuator_gains('kp=500.0,kv=1.0')
+        first['kp'] = 0.0
+        second = parse_actuator_gains('kp=500.0,kv=1.0')
+        assert second == {'kp': 500.0, 'kv': 1.0}
+        assert second is not first
+
     # Error cases
     
     def test_invalid_key(self):
@@ -88,6 +103,11 @@ class TestParseActuatorGains:
         with pytest.raises(ValueError, match="Invalid format"):
             parse_actuator_gains('kp500.0,kv1.0')
     
+    def test_stray_token_rejected(self):
+        """Test that a token without '=' after valid pairs is not silently dropped"""
+        with pytest.raises(ValueError, match="Invalid format: 'junk'"):
+            parse_actuator_gains('kp=500.0,kv=1.0,junk')
+
     def test_empty_string(self):
         """Test that empty string raises ValueError"""
         with pytest.raises(ValueError, match="No valid key=value pairs found"):
@@ -113,6 +133,135 @@ class TestParseActuatorGains:
         assert result['kv'] == 1.0
 
 
+class _StrCounter:
+    """Counts how often it is rendered into a log message"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "counted"
+
+
+class TestPrintFunctions:
+    """Test suite for the print_* logging helpers"""
+
+    def setup_method(self):
+        self._saved_level = _utils._log_level
+
+    def teardown_method(self):
+        set_log_level(self._saved_level)
+
+    def test_suppressed_debug_skips_formatting(self):
+        """Test that lazy arguments are not rendered below the log level"""
+        set_log_level("INFO")
+        counter = _StrCounter()
+        print_debug("value: %s", counter)
+        assert counter.calls == 0
+
+    def test_enabled_debug_formats_arguments(self):
+        """Test that lazy arguments are rendered when enabled"""
+        set_log_level("DEBUG")
+        counter = _StrCounter()
+        print_debug("value: %s", counter)
+        assert counter.calls >= 1
+
+    def test_print_error_without_active_exception_writes_no_traceback(self, capsys):
+        """Test that exc_info=True outside an except block prints nothing to stderr"""
+        print_error("failure", exc_info=True)
+        assert capsys.readouterr().err == ""
+
+    def test_level_flags_follow_set_log_level(self):
+        """Test that the cached level flags track set_log_level"""
+        set_log_level("WARNING")
+        assert (_utils.DEBUG_ENABLED, _utils.INFO_ENABLED, _utils._WARN_ON) == (False, False, True)
+        set_log_level(logging.DEBUG)
+        assert (_utils.DEBUG_ENABLED, _utils.INFO_ENABLED, _utils._WARN_ON) == (True, True, True)
+
+    def test_log_batch_writes_lines_in_one_print(self):
+        """Test that batched info/debug lines reach the console as one block"""
+
+        class _Console:
+            def __init__(self):
+                self.printed = []
+
+            def print(self, text):
+                self.printed.append(text)
+
+        console = _Console()
+        set_log_level("DEBUG")
+        _utils.set_rich_console(console)
+        try:
+            with _utils.log_batch():
+                _utils.print_info("first %d", 1)
+                print_debug("second")
+                assert console.printed == []
+        finally:
+            _utils.clear_rich_console()
+        assert console.printed == ["[green]first 1[/green]\n[blue][DEBG] second[/blue]"]
+
+    def test_log_batch_flushes_before_warning(self):
+        """Test that a warning inside a batch follows the lines logged before it"""
+
+        class _Console:
+            def __init__(self):
+                self.printed = []
+
+            def print(self, text):
+                self.printed.append(text)
+
+        console = _Console()
+        set_log_level("INFO")
+        _utils.set_rich_console(console)
+        try:
+            with _utils.log_batch():
+                _utils.print_info("checking")
+                _utils.print_warning("failed")
+                _utils.print_info("done")
+        finally:
+            _utils.clear_rich_console()
+        assert console.printed == [
+            "[green]checking[/green]",
+            "[yellow][WARN] failed[/yellow]",
+            "[green]done[/green]",
+        ]
+
+    def test_captured_records_replay_through_console(self):
+        """Test that capture_logs() holds records back until replay_logs()"""
+
+        class _Console:
+            def __init__(self):
+                self.printed = []
+
+            def print(self, text):
+                self.printed.append(text)
+
+        console = _Console()
+        set_log_level("INFO")
+        _utils.set_rich_console(console)
+        try:
+            with _utils.capture_logs() as records:
+                _utils.print_info("done %d", 1)
+                print_debug("hidden")
+                _utils.print_warning("careful")
+            assert console.printed == []
+            _utils.replay_logs(records)
+        finally:
+            _utils.clear_rich_console()
+        assert console.printed == [
+            "[green]done 1[/green]",
+            "[yellow][WARN] careful[/yellow]",
+        ]
+
+    def test_handler_installed_once(self):
+        """Test that repeated set_log_level calls do not stack handlers"""
+        set_log_level("INFO")
+        handlers = list(_utils._logger.handlers)
+        set_log_level("DEBUG")
+        assert _utils._logger.handlers == handlers
+
+
 if __name__ == '__main__':
     # Run tests if executed directly
     pytest.main([__file__, '-v'])
@@ -1,12 +1,13 @@
 """Public Python API for URDF/Xacro to MJCF conversion."""
 
+import os
 from collections.abc import Mapping
 from os import PathLike
 from typing import Any
 
 from _utils import parse_actuator_gains, set_log_level
 
-from .cli import ConfigLoader, build_argument_parser
+from .cli import INPUT_EXTENSIONS, build_argument_parser, load_config
 
 
 def build_conversion_args(
@@ -46,9 +47,7 @@ def build_conversion_args(
         input_path = None
 
     if config_file:
-        loaded_args = ConfigLoader(parser).load_config(
-            config_file, args, strict=True
-        )
+        loaded_args = load_config(config_file, args, strict=True)
         if loaded_args is not None:
             args = loaded_args
     args.config_file = config_file
@@ -80,8 +79,8 @@ def build_conversion_args(
         )
 
     args.input = str(args.input)
-    input_ext = args.input.rsplit(".", 1)[-1].lower()
-    if input_ext not in {"urdf", "xacro"}:
+    input_ext = os.path.splitext(args.input)[1].lower().lstrip(".")
+    if input_ext not in INPUT_EXTENSIONS:
         raise ValueError(
             "Input file must be a URDF (.urdf) or xacro (.xacro) file, "
             f"not .{input_ext}"
@@ -1,12 +1,22 @@
 import argparse
+import copy
+import functools
 import json
 import os
-import sys
 import subprocess
 import shutil
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from . import __version__
 from _utils import (
+    enable_log_queue,
+    log_batch,
     set_log_level,
     print_confirm,
     print_warning,
@@ -15,68 +25,90 @@ from _utils import (
 )
 
 
-class ConfigLoader:
-    def __init__(self, parser):
-        self.parser = parser
-
-    def load_config(
-        self, config_file, current_args, provided_args=None, strict=False
-    ):
-        """
-        Apply JSON config to args, with CLI args taking precedence.
-        The function loads the JSON file and manually updates the namespace,
-        preserving CLI arguments that were explicitly provided.
-        """
-        if not config_file or not os.path.exists(config_file):
-            if strict:
-                raise FileNotFoundError(f"Config file '{config_file}' not found.")
-            print_warning(
-                f"Config file '{config_file}' not found. Using default arguments and CLI overrides only."
-            )
-            return None
-
-        # Load config from JSON file
-        with open(config_file, "r") as f:
-            config_data = json.load(f)
-
-        # Version compatibility check
-        config_version = config_data.get("urdf2mjcf_version")
-        if config_version is None:
-            print_warning(
-                f"Config file '{config_file}' has no 'urdf2mjcf_version' field — "
-                f"it was generated by an older version of urdf2mjcf (current: {__version__}). "
-                "Re-run to update it."
-            )
-        elif config_version != __version__:
-            print_warning(
-                f"Config file version '{config_version}' does not match "
-                f"current urdf2mjcf version '{__version__}'. "
-                "Some options may be missing or changed. Re-run to update the config."
-            )
+# Accepted input file extensions (lower-case, without the dot)
+INPUT_EXTENSIONS = frozenset({"urdf", "xacro"})
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config_file(config_file, mtime_ns, size):
+    """Decode a JSON config file.
+
+    Cached on (path, mtime, size) so scripts converting many robots from the
+    same config only decode it once; any edit to the file invalidates the entry.
+    """
+    with open(config_file, "rb") as f:
+        raw = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_config(
+    config_file,
+    current_args,
+    provided_args=None,
+    strict=False,
+):
+    """
+    Apply JSON config to args, with CLI args taking precedence.
+    The function loads the JSON file and manually updates the namespace,
+    preserving CLI arguments that were explicitly provided.
+    """
+    if not config_file or not os.path.exists(config_file):
+        if strict:
+            raise FileNotFoundError(f"Config file '{config_file}' not found.")
+        print_warning(
+            f"Config file '{config_file}' not found. Using default arguments and CLI overrides only."
+        )
+        return None
+
+    # Load config from JSON file. The cached dict is shared between calls,
+    # so hand out a copy that callers are free to mutate.
+    stat = os.stat(config_file)
+    config_data = copy.deepcopy(
+        _read_config_file(
+            os.path.abspath(config_file), stat.st_mtime_ns, stat.st_size
+        )
+    )
 
-        # Get the current arguments that were explicitly set via CLI
-        # We'll preserve these and only update the ones not set
-        provided_args = set(provided_args or ())
+    # Version compatibility check
+    config_version = config_data.get("urdf2mjcf_version")
+    if config_version is None:
+        print_warning(
+            f"Config file '{config_file}' has no 'urdf2mjcf_version' field — "
+            f"it was generated by an older version of urdf2mjcf (current: {__version__}). "
+            "Re-run to update it."
+        )
+    elif config_version != __version__:
+        print_warning(
+            f"Config file version '{config_version}' does not match "
+            f"current urdf2mjcf version '{__version__}'. "
+            "Some options may be missing or changed. Re-run to update the config."
+        )
 
-        # Update namespace with config values, but don't override CLI args
-        for key, value in config_data.items():
-            # Convert key format (e.g., 'add-floor' -> 'add_floor')
-            dest_key = key.replace("-", "_")
+    # Get the current arguments that were explicitly set via CLI
+    # We'll preserve these and only update the ones not set
+    provided_args = set(provided_args or ())
 
-            # Skip the version marker — it's metadata, not an argparse dest
-            if dest_key == "urdf2mjcf_version":
-                continue
+    # Update namespace with config values, but don't override CLI args
+    for key, value in config_data.items():
+        # Convert key format (e.g., 'add-floor' -> 'add_floor')
+        dest_key = key.replace("-", "_")
+
+        # Skip the version marker — it's metadata, not an argparse dest
+        if dest_key == "urdf2mjcf_version":
+            continue
 
-            # Only set if not provided via CLI (except for the special case of input)
-            if dest_key not in provided_args:
-                # Special handling for default_actuator_gains
-                if dest_key == "default_actuator_gains":
-                    value = parse_actuator_gains(value)
-                setattr(current_args, dest_key, value)
+        # Only set if not provided via CLI (except for the special case of input)
+        if dest_key not in provided_args:
+            # Special handling for default_actuator_gains
+            if dest_key == "default_actuator_gains":
+                value = parse_actuator_gains(value)
+            setattr(current_args, dest_key, value)
 
-        print_confirm(f"Loaded configuration from '{config_file}'")
+    print_confirm(f"Loaded configuration from '{config_file}'")
 
-        return current_args
+    return current_args
 
 
 def build_argument_parser():
@@ -306,6 +338,14 @@ def build_argument_parser():
         metavar="COUNT",
         help="Maximum faces per mesh file (MuJoCo limit: 200000, default: 200000).",
     )
+    advanced_group.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Parallel workers for mesh copy, validation and simplification (default: CPU count).",
+    )
     advanced_group.add_argument(
         "-sr",
         "--simplify-reduction",
@@ -338,6 +378,12 @@ def build_argument_parser():
         action="store_true",
         help="Generate convex hull collision meshes from visual meshes.",
     )
+    advanced_group.add_argument(
+        "-hlm",
+        "--hardlink-meshes",
+        action="store_true",
+        help="Hardlink STL/OBJ meshes that are not simplified instead of copying them (same filesystem only).",
+    )
     advanced_group.add_argument(
         "-scm",
         "--simplify-collision-meshes",
@@ -388,6 +434,12 @@ def build_argument_parser():
         action="store_true",
         help="Save the intermediate, pre-processed URDF file for debugging.",
     )
+    advanced_group.add_argument(
+        "-npo",
+        "--no-pretty-output",
+        action="store_true",
+        help="Write the final MJCF without indentation (faster for large models that are only loaded by MuJoCo).",
+    )
     advanced_group.add_argument(
         "-nzi",
         "--no-zero-inertial-rpy",
@@ -443,6 +495,16 @@ def build_argument_parser():
         default=["hangup:=true", "hardware_type:=sim_mujoco"],
         help="Arguments to pass to the xacro processor, e.g., 'param1:=true' 'param2:=false'",
     )
+    advanced_group.add_argument(
+        "-nxc",
+        "--no-xacro-cache",
+        action="store_true",
+        help=(
+            "Always run xacro instead of reusing a cached expansion from "
+            "~/.cache/urdf2mjcf/xacro (reused only while the input, its xacro "
+            "dependencies and the xacro args are unchanged)."
+        ),
+    )
     advanced_group.add_argument(
         "-ll",
         "--log-level",
@@ -468,16 +530,22 @@ def build_argument_parser():
     return parser
 
 
-def _provided_argument_names(parser, argv):
-    provided_args = set()
-    for arg in argv:
-        if not arg.startswith("-"):
-            continue
-        option = arg.split("=", 1)[0]
-        for action in parser._actions:
-            if option in action.option_strings:
-                provided_args.add(action.dest)
-                break
+def _provided_argument_names(argv):
+    """Return the destinations of options explicitly given on the command line.
+
+    The arguments are re-parsed with every default replaced by
+    ``argparse.SUPPRESS``, so only options the user actually passed end up in
+    the namespace. Unlike scanning argv for option strings, this also covers
+    abbreviated long options such as ``--height-above 0.3``.
+    """
+    sentinel_parser = build_argument_parser()
+    for action in sentinel_parser._actions:
+        action.default = argparse.SUPPRESS
+    provided, _ = sentinel_parser.parse_known_args(argv)
+    provided_args = set(vars(provided))
+    # The positional input is handled by main(), which must tell URDF inputs
+    # apart from auto-detected JSON configs.
+    provided_args.discard("input")
     return provided_args
 
 
@@ -487,9 +555,7 @@ def main(argv=None):
 
     # Initial parse to get log level and config file path
     args, _ = parser.parse_known_args(argv)
-    provided_args = _provided_argument_names(
-        parser, argv if argv is not None else sys.argv[1:]
-    )
+    provided_args = _provided_argument_names(argv)
     if args.input and not args.input.endswith(".json"):
         provided_args.add("input")
 
@@ -497,22 +563,21 @@ def main(argv=None):
     config_file = args.config_file
     input_file = args.input
 
-    if args.input and args.input.endswith(".json"):
-        # If input is a JSON file, treat it as config file
-        config_file = args.input
-        input_file = None  # Will be set from config
-        print_info(f"Auto-detected JSON config file: {config_file}")
-
-    if config_file:
-        config_loader = ConfigLoader(parser)
-        loaded_args = config_loader.load_config(
-            config_file, args, provided_args=provided_args
-        )
-        if loaded_args:
-            args = loaded_args
-            # If we auto-detected config, get input from the loaded config
-            if input_file is None and hasattr(args, "input") and args.input:
-                input_file = args.input
+    # Startup messages go out in one write; log_batch keeps each line's color
+    with log_batch():
+        if args.input and args.input.endswith(".json"):
+            # If input is a JSON file, treat it as config file
+            config_file = args.input
+            input_file = None  # Will be set from config
+            print_info("Auto-detected JSON config file: %s", config_file)
+
+        if config_file:
+            loaded_args = load_config(config_file, args, provided_args=provided_args)
+            if loaded_args:
+                args = loaded_args
+                # If we auto-detected config, get input from the loaded config
+                if input_file is None and hasattr(args, "input") and args.input:
+                    input_file = args.input
 
     # Set the final input file
     if input_file:
@@ -523,7 +588,8 @@ def main(argv=None):
             "Input URDF or xacro file must be specified either as argument or in config file."
         )
     else:
-        if (input_ext := args.input.split(".")[-1]) not in ["urdf", "xacro"]:
+        input_ext = os.path.splitext(args.input)[1].lower().lstrip(".")
+        if input_ext not in INPUT_EXTENSIONS:
             raise ValueError(
                 f"Input file must be a URDF (.urdf) or xacro (.xacro) file, not {input_ext}"
             )
@@ -534,6 +600,8 @@ def main(argv=None):
 
     # Update log level again in case it was in the config
     set_log_level(args.log_level, args.traceback)
+    # Keep stdout writes off the conversion thread for the CLI run
+    enable_log_queue()
 
     from .converter import URDFToMJCFConverter
 
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
+import importlib.util
 import os
 import subprocess
 import sys
 import venv
-from _utils import print_info, print_error, print_info
+from _utils import flush_logs, print_info, print_error
 
 
 def setup_mujoco_venv():
@@ -15,72 +16,70 @@ def setup_mujoco_venv():
     # Path to the virtual environment directory, located alongside the script
     venv_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".venv")
 
+    # Paths to python/pip in the venv, computed once
+    if sys.platform == "win32":
+        bin_dir = os.path.join(venv_dir, "Scripts")
+        python_exe = os.path.join(bin_dir, "python.exe")
+        pip_exe = os.path.join(bin_dir, "pip.exe")
+    else:
+        bin_dir = os.path.join(venv_dir, "bin")
+        python_exe = os.path.join(bin_dir, "python")
+        pip_exe = os.path.join(bin_dir, "pip")
+
     # Check if we are running inside our target venv by comparing sys.prefix
-    is_in_venv = os.path.abspath(sys.prefix) == os.path.abspath(venv_dir)
+    is_in_venv = os.path.isdir(venv_dir) and os.path.samefile(sys.prefix, venv_dir)
 
-    python_exe_exists = (
-        os.path.isfile(os.path.join(venv_dir, "bin", "python"))
-        if not is_in_venv
-        else False
-    )
-
-    try:
-        import mujoco
+    python_exe_exists = os.path.isfile(python_exe) if not is_in_venv else False
 
+    # find_spec only locates the package; importing it here would load
+    # mujoco's native libraries just to check that they exist.
+    if importlib.util.find_spec("mujoco") is not None:
         return  # mujoco is already available
-    except ImportError:
-        # If we are in the venv but the import fails, something is wrong.
-        if is_in_venv and not python_exe_exists:
-            print_error(
-                f"Running in the virtual environment at '{venv_dir}' but "
-                f"the 'mujoco' package is still not found.\n"
-                f"Try deleting the '.venv' directory and running again."
-            )
-            sys.exit(1)
-        elif python_exe_exists:
-            print_info(
-                f"Virtual environment found at '{venv_dir}'. Re-launching script within it."
-            )
-            os.execv(
-                os.path.join(venv_dir, "bin", "python"),
-                [os.path.join(venv_dir, "bin", "python")] + sys.argv,
-            )
-
-        # Not in venv and mujoco not found globally. Let's set it up.
-        print_info("--- MuJoCo Dependency Setup ---")
+
+    # If we are in the venv but mujoco is missing, something is wrong.
+    if is_in_venv and not python_exe_exists:
+        print_error(
+            f"Running in the virtual environment at '{venv_dir}' but "
+            f"the 'mujoco' package is still not found.\n"
+            f"Try deleting the '.venv' directory and running again."
+        )
+        sys.exit(1)
+    elif python_exe_exists:
         print_info(
-            "Python package 'mujoco' not found. Setting up a local virtual environment."
+            "Virtual environment found at '%s'. Re-launching script within it.",
+            venv_dir,
         )
+        flush_logs()
+        os.execv(python_exe, [python_exe] + sys.argv)
+
+    # Not in venv and mujoco not found globally. Let's set it up.
+    print_info("--- MuJoCo Dependency Setup ---")
+    print_info(
+        "Python package 'mujoco' not found. Setting up a local virtual environment."
+    )
 
-        # 1. Create venv if it doesn't exist
-        if not os.path.isdir(venv_dir):
-            print_info(f"Creating virtual environment in '{venv_dir}'...")
-            try:
-                venv.create(venv_dir, with_pip=True)
-            except Exception as e:
-                print_error(f"Could not create virtual environment.\n{e}")
-                sys.exit(1)
-
-        # 2. Get path to python/pip in venv
-        if sys.platform == "win32":
-            pip_exe = os.path.join(venv_dir, "Scripts", "pip.exe")
-            python_exe = os.path.join(venv_dir, "Scripts", "python.exe")
-        else:
-            pip_exe = os.path.join(venv_dir, "bin", "pip")
-            python_exe = os.path.join(venv_dir, "bin", "python")
-
-        # 3. Install mujoco
-        print_info("Installing 'mujoco' package...")
+    # 1. Create venv if it doesn't exist
+    if not os.path.isdir(venv_dir):
+        print_info("Creating virtual environment in '%s'...", venv_dir)
         try:
-            subprocess.check_call([pip_exe, "install", "mujoco"])
-        except subprocess.CalledProcessError as e:
-            print_error(f"Failed to install 'mujoco' using pip.\n{e}")
+            venv.create(venv_dir, with_pip=True)
+        except Exception as e:
+            print_error(f"Could not create virtual environment.\n{e}")
             sys.exit(1)
 
-        # 4. Relaunch script with the venv's python
-        print_info("Installation successful. Relaunching script...")
-        print_info("---------------------------------\n")
-        os.execv(python_exe, [python_exe] + sys.argv)
+    # 2. Install mujoco
+    print_info("Installing 'mujoco' package...")
+    try:
+        subprocess.check_call([pip_exe, "install", "mujoco"])
+    except subprocess.CalledProcessError as e:
+        print_error(f"Failed to install 'mujoco' using pip.\n{e}")
+        sys.exit(1)
+
+    # 3. Relaunch script with the venv's python
+    print_info("Installation successful. Relaunching script...")
+    print_info("---------------------------------\n")
+    flush_logs()
+    os.execv(python_exe, [python_exe] + sys.argv)
 
 
 if __name__ == "__main__":
@@ -1,26 +1,25 @@
+import argparse
+import functools
+import hashlib
+import io
 import os
 import re
 import sys
 import shutil
 import subprocess
-import tempfile
 import json
 import xml.etree.ElementTree as ET
-import copy
-import mujoco
-
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    BarColumn,
-    TaskProgressColumn,
-)
-from rich.live import Live
-from rich.console import Console
 
-from . import urdf_preprocess, mesh_ops, mjcf_postprocess
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from . import urdf_preprocess, mesh_ops, mjcf_postprocess, xml_utils
 from . import __version__
+import _utils
 from _utils import (
     print_debug,
     print_info,
@@ -34,8 +33,164 @@ from _utils import (
 _DEFAULT_ROS2_CONTROL_INSTANCE = "ros2_control"
 _DEFAULT_MESH_DIR = "assets/"
 
-# Global console for rich output
-console = Console()
+
+@functools.lru_cache(maxsize=1)
+def _get_console():
+    """Return the shared rich console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+# Options a Namespace built by an older config or by hand may lack, with the
+# values convert() falls back to. Resolved once per conversion.
+_ARG_FALLBACKS = {
+    "collision_subdir": None,
+    "dae_up_axis": "auto",
+    "simplify_collision_meshes": False,
+    "simplify_collision_reduction": None,
+    "simplify_collision_target_faces": None,
+    "jobs": None,
+    "no_xacro_cache": False,
+    "no_pretty_output": False,
+    "hardlink_meshes": False,
+}
+
+
+_xacro_exe = None
+
+
+def _xacro_path():
+    """Return the xacro executable, searching PATH only until it is found."""
+    global _xacro_exe
+    if _xacro_exe is None:
+        _xacro_exe = shutil.which("xacro")
+    return _xacro_exe
+
+
+# Environment variables that decide where $(find pkg) resolves to
+_XACRO_PACKAGE_PATH_VARS = ("AMENT_PREFIX_PATH", "ROS_PACKAGE_PATH")
+# Names read through $(env NAME) or $(optenv NAME ...)
+_XACRO_ENV_REF_RE = re.compile(rb"\$\((?:env|optenv)\s+([A-Za-z_][A-Za-z0-9_]*)")
+
+
+def _xacro_env_values(data):
+    """Return {name: value} for every $(env)/$(optenv) variable used in *data*."""
+    return {
+        name: os.environ.get(name)
+        for name in {m.decode() for m in _XACRO_ENV_REF_RE.findall(data)}
+    }
+
+
+def _xacro_cache_path(input_path, xacro_args, xacro_exe):
+    """Return the cache file for a xacro expansion.
+
+    The key covers the input's content and location (relative includes
+    depend on it), the sorted xacro arguments, the xacro executable, the
+    package search paths and the variables the input reads with
+    $(env)/$(optenv). Variables read by included files are checked against
+    the .deps record instead (see _xacro_cache_valid).
+    """
+    key = hashlib.blake2b(digest_size=16)
+    with open(input_path, "rb") as f:
+        data = f.read()
+    key.update(data)
+    env_parts = [
+        f"{name}={os.environ.get(name)}"
+        for name in _XACRO_PACKAGE_PATH_VARS
+    ]
+    env_parts += sorted(f"{k}={v}" for k, v in _xacro_env_values(data).items())
+    for part in [
+        os.path.abspath(input_path),
+        xacro_exe,
+        *sorted(xacro_args or ()),
+        *env_parts,
+    ]:
+        key.update(b"\0" + part.encode())
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_root, "urdf2mjcf", "xacro", key.hexdigest() + ".urdf")
+
+
+def _xacro_cache_valid(cache_path):
+    """Check that a cached expansion exists, no dependency is newer and every
+    environment variable the dependencies read still has its recorded value."""
+    deps_path = cache_path + ".deps"
+    try:
+        cache_mtime = os.path.getmtime(cache_path)
+        with open(deps_path) as f:
+            record = json.load(f)
+        if any(os.environ.get(k) != v for k, v in record["env"].items()):
+            return False
+        return all(os.path.getmtime(dep) <= cache_mtime for dep in record["deps"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def _start_xacro_deps(xacro_command):
+    """Start ``xacro --deps`` alongside the expansion so a cache miss does not
+    wait for a second xacro run."""
+    return subprocess.Popen(
+        [xacro_command[0], "--deps", *xacro_command[1:]],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+
+
+def _store_xacro_cache(cache_path, urdf_bytes, deps_proc):
+    """Store an expanded URDF in the cache with the files it depends on.
+
+    Dependencies come from the ``xacro --deps`` process started by
+    _start_xacro_deps; if they cannot be listed the expansion is not cached,
+    since an included file could change unnoticed. The $(env)/$(optenv)
+    values those files read are recorded next to them.
+    """
+    tmp_paths = []
+    try:
+        deps_out, _ = deps_proc.communicate()
+        if deps_proc.returncode != 0:
+            raise subprocess.CalledProcessError(deps_proc.returncode, deps_proc.args)
+        deps = deps_out.split()
+        env = {}
+        for dep in deps:
+            with open(dep, "rb") as f:
+                env.update(_xacro_env_values(f.read()))
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write to temporary names first so readers never see a partial file
+        for path, data in (
+            (cache_path + ".deps", json.dumps({"deps": deps, "env": env}).encode()),
+            (cache_path, urdf_bytes),
+        ):
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            tmp_paths.append(tmp_path)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print_debug("Could not cache xacro output: %s", e)
+        for tmp_path in tmp_paths:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+# Anything xacro would expand: namespaced tags/attributes, ${...} and $(...)
+_XACRO_FEATURE_RE = re.compile(rb"xacro:|\$[{(]")
+
+
+def _read_plain_urdf(input_path):
+    """Return the file contents if a .xacro file uses no xacro features.
+
+    Some packages name plain URDFs ``*.urdf.xacro`` by convention; running
+    xacro on those only costs a subprocess and interpreter start-up.
+
+    Returns:
+        bytes: The file contents, or None if xacro must be run.
+    """
+    with open(input_path, "rb") as f:
+        data = f.read()
+    return None if _XACRO_FEATURE_RE.search(data) else data
 
 
 class URDFToMJCFConverter:
@@ -50,11 +205,29 @@ class URDFToMJCFConverter:
 
     def convert(self):
         """Main conversion pipeline."""
-        args = copy.deepcopy(self.args)
+        # mujoco loads a native library and rich pulls in many submodules;
+        # import them here so importing this module stays cheap.
+        import mujoco
+        from rich.live import Live
+        from rich.progress import (
+            BarColumn,
+            Progress,
+            SpinnerColumn,
+            TaskProgressColumn,
+            TextColumn,
+        )
+
+        console = _get_console()
+
+        # convert() only reads args, so a shallow copy with the fallbacks
+        # filled in is enough; later code uses plain attribute access.
+        args = argparse.Namespace(**{**_ARG_FALLBACKS, **vars(self.args)})
 
-        # Initialize progress bar with Live display
+        # Initialize progress bar with Live display. The spinner only
+        # animates usefully on a terminal, so drop it when output is piped.
+        spinner = (SpinnerColumn(),) if console.is_terminal else ()
         progress = Progress(
-            SpinnerColumn(),
+            *spinner,
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
@@ -64,8 +237,9 @@ class URDFToMJCFConverter:
         # Create single task with 8 steps
         task = progress.add_task("[cyan]Starting conversion...", total=8)
 
-        # Use Live display to keep progress bar at bottom
-        live = Live(progress, console=console, refresh_per_second=10)
+        # Use Live display to keep progress bar at bottom. Steps are coarse,
+        # so a low refresh rate looks the same and costs less CPU.
+        live = Live(progress, console=console, refresh_per_second=4)
 
         tracking_progress = []
 
@@ -90,11 +264,11 @@ class URDFToMJCFConverter:
                 )
                 return
             else:
-                print_info(f"Input file: {input_path}")
+                print_info("Input file: %s", input_path)
 
             if args.output:
                 output_dir = urdf_preprocess.resolve_path(args.output)
-                print_info(f"Using specified output directory: '{output_dir}'")
+                print_info("Using specified output directory: '%s'", output_dir)
             else:
                 print_warning("No output directory specified. Using input directory.")
                 output_dir = os.path.dirname(input_path)
@@ -104,19 +278,17 @@ class URDFToMJCFConverter:
 
             output_dir = os.path.join(output_dir, file_name_without_ext)
             os.makedirs(output_dir, exist_ok=True)
-            output_path = os.path.join(output_dir, f"{file_name_without_ext}.xml")
+            # All outputs share "<output_dir>/<name>" and differ only by suffix
+            output_stem = os.path.join(output_dir, file_name_without_ext)
+            output_path = output_stem + ".xml"
 
             # temp_urdf_path: raw xacro-expanded (or original) URDF
-            temp_urdf_path = os.path.join(
-                output_dir, f"{file_name_without_ext}.temp.urdf"
-            )
+            temp_urdf_path = output_stem + ".temp.urdf"
             # preprocessed_urdf_path: URDF after our preprocess_urdf() mutations
-            preprocessed_urdf_path = os.path.join(
-                output_dir, f"{file_name_without_ext}.preprocessed.urdf"
-            )
+            preprocessed_urdf_path = output_stem + ".preprocessed.urdf"
 
-            print_debug(f"Output directory set to: '{output_dir}'")
-            print_debug(f"Output file will be saved to: '{output_path}'")
+            print_debug("Output directory set to: '%s'", output_dir)
+            print_debug("Output file will be saved to: '%s'", output_path)
             progress.update(task, advance=1)
 
             urdf_to_process = input_path
@@ -126,41 +298,78 @@ class URDFToMJCFConverter:
             print_debug("STEP 2: XACRO PROCESSING")
             print_debug("=" * 100)
             progress.update(task, description="[cyan]Processing XACRO...")
-            if input_path.endswith(".xacro"):
-                print_debug(f"Input file '{base_name}' is a xacro file.")
-                print_debug(
-                    "-> Attempting to convert to URDF using the 'xacro' command..."
-                )
-
-                if not shutil.which("xacro"):
-                    progress.update(task, description="[red]✗ xacro command not found")
-                    live.stop()
-                    clear_rich_console()
-                    print_error(
-                        "The 'xacro' command is not in your PATH. Please install ROS 2 or the 'xacro' package."
+            if input_path.lower().endswith(".xacro"):
+                print_debug("Input file '%s' is a xacro file.", base_name)
+                # Scan even when xacro_args are set (the CLI always passes some):
+                # a file that uses them contains $(arg ...) and is not plain
+                plain_urdf = _read_plain_urdf(input_path)
+                if plain_urdf is not None:
+                    print_debug(
+                        "-> No xacro features found, skipping the xacro command"
+                    )
+                    urdf_to_process = io.BytesIO(plain_urdf)
+                else:
+                    print_debug(
+                        "-> Attempting to convert to URDF using the 'xacro' command..."
                     )
-                    return
 
-                try:
-                    xacro_command = ["xacro", input_path]
-                    if args.xacro_args:
-                        print_debug(
-                            f"-> Passing arguments to xacro: {' '.join(args.xacro_args)}"
+                    xacro_exe = _xacro_path()
+                    if not xacro_exe:
+                        progress.update(task, description="[red]✗ xacro command not found")
+                        live.stop()
+                        clear_rich_console()
+                        print_error(
+                            "The 'xacro' command is not in your PATH. Please install ROS 2 or the 'xacro' package."
                         )
-                        xacro_command.extend(args.xacro_args)
-                    xacro_command.extend(["-o", temp_urdf_path])
+                        return
 
-                    subprocess.run(xacro_command, check=True)
-                    urdf_to_process = temp_urdf_path
-                    print_confirm(
-                        f"-> Successfully converted xacro to temporary URDF: {urdf_to_process}"
-                    )
-                except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                    progress.update(task, description="[red]✗ xacro processing failed")
-                    live.stop()
-                    clear_rich_console()
-                    print_error(f"Failed to run xacro processor.\n{e}")
-                    return
+                    try:
+                        xacro_command = ["xacro", input_path]
+                        if args.xacro_args:
+                            print_debug(
+                                "-> Passing arguments to xacro: %s",
+                                ' '.join(args.xacro_args),
+                            )
+                            xacro_command.extend(args.xacro_args)
+
+                        cache_path = None
+                        if not args.no_xacro_cache:
+                            cache_path = _xacro_cache_path(
+                                input_path, args.xacro_args, xacro_exe
+                            )
+                        if cache_path and _xacro_cache_valid(cache_path):
+                            with open(cache_path, "rb") as f:
+                                urdf_bytes = f.read()
+                            print_confirm("-> Reused cached xacro output")
+                        else:
+                            deps_proc = (
+                                _start_xacro_deps(xacro_command) if cache_path else None
+                            )
+                            try:
+                                # Read the expanded URDF from xacro's stdout instead of
+                                # round-tripping it through a file with -o.
+                                urdf_bytes = subprocess.run(
+                                    xacro_command, check=True, stdout=subprocess.PIPE
+                                ).stdout
+                            except BaseException:
+                                if deps_proc is not None:
+                                    deps_proc.kill()
+                                    deps_proc.wait()
+                                raise
+                            if deps_proc is not None:
+                                _store_xacro_cache(cache_path, urdf_bytes, deps_proc)
+                            print_confirm("-> Successfully converted xacro to URDF")
+                        if args.save_preprocessed:
+                            with open(temp_urdf_path, "wb") as f:
+                                f.write(urdf_bytes)
+                            print_confirm(f"-> Saved xacro output to '{temp_urdf_path}'")
+                        urdf_to_process = io.BytesIO(urdf_bytes)
+                    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+                        progress.update(task, description="[red]✗ xacro processing failed")
+                        live.stop()
+                        clear_rich_console()
+                        print_error(f"Failed to run xacro processor.\n{e}")
+                        return
             progress.update(task, advance=1)
 
             root = None
@@ -188,8 +397,8 @@ class URDFToMJCFConverter:
                 args.separate_dae_meshes,
                 args.append_mesh_type,
                 args.zero_inertial_rpy,
-                getattr(args, "collision_subdir", None),
-                getattr(args, "dae_up_axis", "auto"),
+                args.collision_subdir,
+                args.dae_up_axis,
             )
             progress.update(task, advance=1)
 
@@ -218,10 +427,10 @@ class URDFToMJCFConverter:
                 # Collision simplification params (independent from visual).
                 # Both reduction and target_faces may also be combined here.
                 simplify_collision_params = None
-                simplify_collision_meshes = getattr(args, "simplify_collision_meshes", False)
+                simplify_collision_meshes = args.simplify_collision_meshes
                 if simplify_collision_meshes:
-                    scr = getattr(args, "simplify_collision_reduction", None)
-                    sctf = getattr(args, "simplify_collision_target_faces", None)
+                    scr = args.simplify_collision_reduction
+                    sctf = args.simplify_collision_target_faces
                     if scr is not None or sctf is not None:
                         simplify_collision_params = {}
                         if scr is not None:
@@ -245,62 +454,71 @@ class URDFToMJCFConverter:
                     simplify_params=simplify_params,
                     simplify_collision_meshes=simplify_collision_meshes,
                     simplify_collision_params=simplify_collision_params,
+                    max_workers=args.jobs,
+                    link_passthrough=args.hardlink_meshes,
                 )
 
                 # Update URDF with calculated inertia data
                 if calculated_inertias:
                     print_info(
-                        f"Updating URDF with calculated inertia for {len(calculated_inertias)} link(s)..."
+                        "Updating URDF with calculated inertia for %s link(s)...",
+                        len(calculated_inertias),
                     )
+                    # Index links by name once (first match wins, as before)
+                    link_index = {}
+                    for link_elem in modified_urdf_tree.getroot().iter("link"):
+                        link_index.setdefault(link_elem.get("name"), link_elem)
                     for link_name, inertia_info in calculated_inertias.items():
-                        # Find the link in the URDF tree
-                        for link_elem in modified_urdf_tree.getroot().findall(
-                            ".//link"
-                        ):
-                            if link_elem.get("name") == link_name:
-                                # Find or create inertial element
-                                inertial_elem = link_elem.find("inertial")
-                                if inertial_elem is None:
-                                    inertial_elem = ET.SubElement(link_elem, "inertial")
-
-                                # Update mass
-                                mass_elem = inertial_elem.find("mass")
-                                if mass_elem is None:
-                                    mass_elem = ET.SubElement(inertial_elem, "mass")
-                                mass_elem.set("value", str(inertia_info["mass"]))
-
-                                # Update origin (center of mass)
-                                origin_elem = inertial_elem.find("origin")
-                                if origin_elem is None:
-                                    origin_elem = ET.SubElement(inertial_elem, "origin")
-                                com = inertia_info["center_of_mass"]
-                                origin_elem.set("xyz", f"{com[0]} {com[1]} {com[2]}")
-                                origin_elem.set("rpy", "0 0 0")
-
-                                # Update inertia tensor
-                                inertia_elem = inertial_elem.find("inertia")
-                                if inertia_elem is None:
-                                    inertia_elem = ET.SubElement(
-                                        inertial_elem, "inertia"
-                                    )
-                                inertia_elem.set("ixx", str(inertia_info["ixx"]))
-                                inertia_elem.set("ixy", str(inertia_info["ixy"]))
-                                inertia_elem.set("ixz", str(inertia_info["ixz"]))
-                                inertia_elem.set("iyy", str(inertia_info["iyy"]))
-                                inertia_elem.set("iyz", str(inertia_info["iyz"]))
-                                inertia_elem.set("izz", str(inertia_info["izz"]))
-
-                                inertia_str = "\n".join(
-                                    [
-                                        f'    <mass value="{inertia_info["mass"]}" />',
-                                        f'    <origin xyz="{com[0]} {com[1]} {com[2]}" rpy="0 0 0" />',
-                                        f'    <inertia ixx="{inertia_info["ixx"]}" ixy="{inertia_info["ixy"]}" ixz="{inertia_info["ixz"]}" iyy="{inertia_info["iyy"]}" iyz="{inertia_info["iyz"]}" izz="{inertia_info["izz"]}" />',
-                                    ]
-                                )
-                                print_confirm(
-                                    f"   -> Updated inertial properties for link '{link_name}':\n{inertia_str}"
-                                )
-                                break
+                        link_elem = link_index.get(link_name)
+                        if link_elem is None:
+                            continue
+                        # Find or create inertial element
+                        inertial_elem = link_elem.find("inertial")
+                        if inertial_elem is None:
+                            inertial_elem = ET.SubElement(link_elem, "inertial")
+
+                        # Stringify each value once; it is used for both the
+                        # attributes and the confirmation message below.
+                        mass_str = str(inertia_info["mass"])
+                        com = inertia_info["center_of_mass"]
+                        com_xyz = f"{com[0]} {com[1]} {com[2]}"
+                        tensor = {
+                            key: str(inertia_info[key])
+                            for key in ("ixx", "ixy", "ixz", "iyy", "iyz", "izz")
+                        }
+
+                        # Update mass
+                        mass_elem = inertial_elem.find("mass")
+                        if mass_elem is None:
+                            mass_elem = ET.SubElement(inertial_elem, "mass")
+                        mass_elem.set("value", mass_str)
+
+                        # Update origin (center of mass)
+                        origin_elem = inertial_elem.find("origin")
+                        if origin_elem is None:
+                            origin_elem = ET.SubElement(inertial_elem, "origin")
+                        origin_elem.attrib.update(xyz=com_xyz, rpy="0 0 0")
+
+                        # Update inertia tensor
+                        inertia_elem = inertial_elem.find("inertia")
+                        if inertia_elem is None:
+                            inertia_elem = ET.SubElement(inertial_elem, "inertia")
+                        inertia_elem.attrib.update(tensor)
+
+                        if _utils.INFO_ENABLED:
+                            tensor_attrs = " ".join(
+                                f'{key}="{value}"' for key, value in tensor.items()
+                            )
+                            inertia_str = "\n".join(
+                                [
+                                    f'    <mass value="{mass_str}" />',
+                                    f'    <origin xyz="{com_xyz}" rpy="0 0 0" />',
+                                    f"    <inertia {tensor_attrs} />",
+                                ]
+                            )
+                            print_confirm(
+                                f"   -> Updated inertial properties for link '{link_name}':\n{inertia_str}"
+                            )
             progress.update(task, advance=1)
 
             # Step 5: Validate mesh face counts before MuJoCo import
@@ -308,14 +526,20 @@ class URDFToMJCFConverter:
             print_debug("STEP 5: VALIDATING MESHES")
             print_debug("=" * 100)
             progress.update(task, description="[cyan]Validating meshes...")
-            if args.validate_mesh_faces:
+            # A URDF without meshes gives MuJoCo nothing to load from the mesh
+            # dir, so there is nothing to validate there. With
+            # --no-copy-meshes the dir still holds the meshes MuJoCo will
+            # load, so that case is still validated.
+            if args.validate_mesh_faces and absolute_mesh_paths:
                 tracking_progress.append({"name": "Validate Mesh Face Counts"})
                 print_debug("Validating mesh files before MuJoCo import...")
                 mesh_dir_full_path = os.path.join(output_dir, self.default_mesh_dir)
 
                 if os.path.exists(mesh_dir_full_path):
                     problematic = mesh_ops.validate_all_meshes_in_directory(
-                        mesh_dir_full_path, max_faces=args.max_faces_limit
+                        mesh_dir_full_path,
+                        max_faces=args.max_faces_limit,
+                        max_workers=args.jobs,
                     )
 
                     if problematic:
@@ -335,6 +559,7 @@ class URDFToMJCFConverter:
                             max_faces=args.max_faces_limit,
                             target_reduction_ratio=0.5,  # Reduce to 50% of limit for safety margin
                             backup=True,
+                            max_workers=args.jobs,
                         )
 
                         if fixed > 0:
@@ -353,7 +578,8 @@ class URDFToMJCFConverter:
                         )
                 else:
                     print_info(
-                        f"No mesh directory found at '{mesh_dir_full_path}', skipping validation"
+                        "No mesh directory found at '%s', skipping validation",
+                        mesh_dir_full_path,
                     )
             progress.update(task, advance=1)
 
@@ -362,11 +588,16 @@ class URDFToMJCFConverter:
             print_debug("STEP 6: SAVING PRE-PROCESSED URDF")
             print_debug("=" * 100)
             progress.update(task, description="[cyan]Saving preprocessed URDF...")
-            ET.indent(modified_urdf_tree, space="\t")
-            # Write the modified/preprocessed URDF to a distinct file
-            modified_urdf_tree.write(preprocessed_urdf_path, encoding="unicode")
-
+            # MuJoCo reads the preprocessed URDF straight from memory; it only
+            # touches the disk (pretty-printed) when the user asked to keep it.
+            # Either way the tree is serialized exactly once.
+            if args.save_preprocessed:
+                ET.indent(modified_urdf_tree, space="\t")
+            preprocessed_urdf_xml = ET.tostring(
+                modified_urdf_tree.getroot(), encoding="unicode"
+            )
             if args.save_preprocessed:
+                xml_utils.write_text_atomic(preprocessed_urdf_xml, preprocessed_urdf_path)
                 print_confirm(f"-> Saved pre-processed URDF to '{preprocessed_urdf_path}'")
             progress.update(task, advance=1)
 
@@ -392,7 +623,9 @@ class URDFToMJCFConverter:
             try:
                 os.dup2(_devnull.fileno(), _stderr_fd)
                 # Load spec once; compilation is done (and retried) in the loop.
-                spec = mujoco.MjSpec.from_file(preprocessed_urdf_path)
+                spec = mujoco.MjSpec.from_string(preprocessed_urdf_xml)
+                # Resolve relative mesh paths as if loaded from the output dir
+                spec.modelfiledir = os.path.join(output_dir, "")
                 for _attempt in range(_MAX_SHELL_RETRIES + 1):
                     try:
                         model = spec.compile()
@@ -440,9 +673,11 @@ class URDFToMJCFConverter:
 
             assert xml_string, "Failed to read back the generated MJCF XML"
             root = ET.fromstring(xml_string)
-            print_confirm(
-                f"Loaded pre-processed URDF to Mujoco: {preprocessed_urdf_path}"
-            )
+            # Post-processing only needs the parsed MJCF tree. Drop the compiled
+            # model (with its mesh buffers), the spec and the intermediate XML
+            # so they are not held for the rest of the conversion.
+            del model, spec, xml_string, preprocessed_urdf_xml, modified_urdf_tree
+            print_confirm("Loaded pre-processed URDF to Mujoco")
             progress.update(task, advance=1)
 
         except Exception as e:
@@ -457,10 +692,13 @@ class URDFToMJCFConverter:
         finally:
             # Clean up intermediates unless explicitly asked to keep preprocessed
             if not args.save_preprocessed:
-                if preprocessed_urdf_path and os.path.exists(preprocessed_urdf_path):
-                    os.remove(preprocessed_urdf_path)
-                if temp_urdf_path and os.path.exists(temp_urdf_path):
-                    os.remove(temp_urdf_path)
+                for path in (preprocessed_urdf_path, temp_urdf_path):
+                    if not path:
+                        continue
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
 
         if root is None:
             progress.update(task, description="[red]✗ MJCF root element not created")
@@ -478,11 +716,18 @@ class URDFToMJCFConverter:
             "-> Loaded URDF to MJCF successfully. Applying post-processing MJCF..."
         )
 
-        # Apply damping multiplier if specified
-        if args.damping_multiplier != 1.0:
-            mjcf_postprocess.post_process_damping_multiplier(
-                root, args.damping_multiplier
-            )
+        # Damping multiplier, armature and gravity compensation share one walk
+        # over the tree. Later steps only add plugins, actuators, equalities
+        # and a freejoint, none of which these touch, so applying them this
+        # early is equivalent.
+        mjcf_postprocess.post_process_joint_and_body_attributes(
+            root,
+            damping_multiplier=args.damping_multiplier
+            if args.damping_multiplier != 1.0
+            else None,
+            armature=args.armature,
+            gravity_compensation=args.gravity_compensation,
+        )
         mjcf_postprocess.post_process_set_default_joint_properties(
             root,
             stiffness=args.default_joint_stiffness,
@@ -507,9 +752,6 @@ class URDFToMJCFConverter:
             mjcf_postprocess.post_process_add_ros2_control_plugin(
                 root, self.default_ros2_control_instance, config_file=args.ros2_control_config
             )
-        # Group MujocoRosUtils extension plugins together
-        mjcf_postprocess.post_process_group_ros_utils_plugins(root)
-
         if args.floating_base:
             mjcf_postprocess.post_process_make_base_floating(
                 root, args.height_above_floor
@@ -548,22 +790,18 @@ class URDFToMJCFConverter:
                 mjcf_postprocess.post_process_add_mimic_plugins(
                     root, mimic_joints, args.default_actuator_gains
                 )
-            # Regroup MujocoRosUtils plugins after actuator/mimic insertions
-            mjcf_postprocess.post_process_group_ros_utils_plugins(root)
 
-        if args.gravity_compensation:
-            mjcf_postprocess.post_process_add_gravity_compensation(root)
-        if args.armature is not None:
-            mjcf_postprocess.post_process_set_joint_armature(root, args.armature)
         if args.solver or args.integrator:
             mjcf_postprocess.post_process_set_simulation_options(
                 root, solver=args.solver, integrator=args.integrator
             )
 
-        # Final regroup to ensure MujocoRosUtils plugins are contiguous
         mjcf_postprocess.post_process_inject_custom_mujoco_elements(
             root, custom_mujoco_elements
         )
+        # Group MujocoRosUtils extension plugins together. Grouping is a stable
+        # partition and the steps above only append plugins, so a single pass
+        # at the end gives the same order as regrouping after each step.
         mjcf_postprocess.post_process_group_ros_utils_plugins(root)
 
         # Assign visual geoms to group 2 (visible) and collision geoms to group 3 (hidden by default)
@@ -575,8 +813,9 @@ class URDFToMJCFConverter:
         result_path = None
         try:
             tree = ET.ElementTree(root)
-            ET.indent(tree, space="\t")
-            tree.write(output_path, encoding="utf-8", xml_declaration=True)
+            if not args.no_pretty_output:
+                ET.indent(tree, space="\t")
+            xml_utils.write_tree_atomic(tree, output_path, xml_declaration=True)
             print_confirm("-> Saved final MJCF output.\n")
             progress.update(task, description="[green]✓ Conversion complete!")
             live.stop()
@@ -585,7 +824,7 @@ class URDFToMJCFConverter:
             print_debug("\n" + "=" * 100)
             print_debug("CONVERSION COMPLETED SUCCESSFULLY")
             print_debug("=" * 100)
-            print_debug(f"Output saved to: {output_path}")
+            print_debug("Output saved to: %s", output_path)
             print_warning(
                 "REMEMBER TO BUILD THE PACKAGE SO THE ASSET FILES ARE COPIED OR LINKED!"
             )
@@ -624,8 +863,17 @@ class URDFToMJCFConverter:
 
         config_path = os.path.join(output_dir, "config.json")
         try:
-            with open(config_path, "w") as f:
-                json.dump(args_to_save, f, indent=4)
-            print_debug(f"-> Arguments saved to '{config_path}'")
+            # Serialize up front so the file is written in a single call. Both
+            # paths produce the same text (2-space indent, raw UTF-8), so the
+            # file does not change depending on whether orjson is installed.
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(args_to_save, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(
+                    args_to_save, indent=2, ensure_ascii=False
+                ).encode("utf-8")
+            with open(config_path, "wb") as f:
+                f.write(payload)
+            print_debug("-> Arguments saved to '%s'", config_path)
         except Exception as e:
             print_warning(f"Could not save arguments to '{config_path}'. Error: {e}")
@@ -1,9 +1,24 @@
+import contextlib
+import functools
 import hashlib
+import importlib.util
+import io
+import json
+import multiprocessing
 import os
+import re
 import shutil
+import struct
+import sys
 import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+import xml.etree.ElementTree as ET
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from threading import Event, Lock
 
 
 def _compute_file_hash(path: str) -> str:
@@ -13,14 +28,55 @@ def _compute_file_hash(path: str) -> str:
         for chunk in iter(lambda: f.read(65536), b""):
             h.update(chunk)
     return h.hexdigest()
-from _utils import print_debug, print_info, print_warning, print_error, print_confirm
+
 
 try:
-    import pymeshlab
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux FICLONE ioctl: share the source's extents instead of copying bytes
+_FICLONE = 0x40049409 if sys.platform.startswith("linux") else None
 
-    PYMESHLAB_AVAILABLE = True
-except ImportError:
-    PYMESHLAB_AVAILABLE = False
+
+def _copy_mesh_file(src: str, dst: str) -> None:
+    """Copy a mesh's contents, doing as little data movement as possible.
+
+    Tries, in order: a FICLONE reflink (btrfs/XFS, near-instant regardless of
+    size), os.copy_file_range (stays in the kernel; server-side on NFS 4.2),
+    and finally shutil.copyfile. Like shutil.copyfile, metadata is not
+    copied: nothing downstream reads the source's mode, timestamps or xattrs,
+    and copystat() alone costs several syscalls per mesh.
+    """
+    copied = False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            if fcntl is not None and _FICLONE is not None:
+                try:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                    copied = True
+                except OSError:
+                    pass
+            if not copied and hasattr(os, "copy_file_range"):
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+                copied = remaining == 0
+    except OSError:
+        copied = False
+    if not copied:
+        shutil.copyfile(src, dst)
+
+
+import _utils
+from _utils import print_base, print_debug, print_info, print_warning, print_error, print_confirm
+
+# pymeshlab loads a large native library, so only check that it is installed
+# here; it is imported on first use (see _reusable_meshset).
+PYMESHLAB_AVAILABLE = importlib.util.find_spec("pymeshlab") is not None
 
 # Import mesh tools
 try:
@@ -31,8 +87,6 @@ except ImportError as e:
     print_warning(
         f"Failed importing calculate_inertia tool: {e}\n{traceback.format_exc()}"
     )
-    import sys
-
     sys.exit(1)
     CALCULATE_INERTIA_AVAILABLE = False
 
@@ -49,12 +103,121 @@ except ImportError as e:
 try:
     from urdf2mjcf.tools.simplify_mesh import simplify_mesh as simplify_mesh_tool
 
-    SIMPLIFY_MESH_TOOL_AVAILABLE = True
+    SIMPLIFY_MESH_TOOL_AVAILABLE = PYMESHLAB_AVAILABLE
 except ImportError:
     SIMPLIFY_MESH_TOOL_AVAILABLE = False
 
+# Side-car in the output mesh dir recording what produced each mesh, so
+# re-runs can skip meshes whose source and settings are unchanged
+_MESH_CACHE_NAME = ".urdf2mjcf_cache.json"
+
+# OBJ face lines, allowing leading indentation (slow path of count_mesh_faces)
+_OBJ_FACE_LINE_RE = re.compile(rb"^[ \t\r\f\v]*f ", re.MULTILINE)
+
+# ASCII STL facet terminator in any letter case; matched on the raw bytes so
+# counting needs no lowercased copy of the file
+_STL_ENDFACET_RE = re.compile(rb"endfacet", re.IGNORECASE)
+
 # Global lock for pymeshlab operations (not thread-safe)
 _pymeshlab_lock = Lock()
+# One MeshSet per process, reused so MeshLab's filter setup happens once
+_meshset = None
+
+
+def _reusable_meshset():
+    """Return this process's pymeshlab MeshSet, emptied for the next mesh.
+
+    Callers must hold _pymeshlab_lock, or be the only thread using pymeshlab
+    (as in the worker processes).
+    """
+    global _meshset
+    if _meshset is None:
+        import pymeshlab
+
+        _meshset = pymeshlab.MeshSet()
+    else:
+        _meshset.clear()
+    return _meshset
+
+
+@contextlib.contextmanager
+def _borrowed_meshset():
+    """Yield the reusable MeshSet and empty it again afterwards.
+
+    Clearing on the way out frees the last mesh's geometry instead of keeping
+    it resident until the next pymeshlab call in this process.
+    """
+    ms = _reusable_meshset()
+    try:
+        yield ms
+    finally:
+        ms.clear()
+
+
+def _simplify_with_tool(*args):
+    """Run the simplify_mesh tool on this process's reusable MeshSet."""
+    with _borrowed_meshset() as ms:
+        return simplify_mesh_tool(*args, ms=ms)
+
+
+def _mesh_process_pool(max_workers):
+    """Process pool for pymeshlab work, which cannot run in parallel threads.
+
+    Uses spawn rather than fork: the converter already has logging and rich
+    threads running, and forking those can deadlock the children. Spawned
+    children start from the default log level, so the initializer hands them
+    the parent's. Submit work with _submit_to_worker() so that its output is
+    printed by the parent.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_utils.set_log_level,
+        initargs=(_utils._log_level, _utils._show_traceback),
+    )
+
+
+def _run_captured(func, *args, **kwargs):
+    """Worker side of _submit_to_worker: run func and collect its output.
+
+    Returns (result, error, log_records, stdout_text, stderr_text). Errors
+    are returned rather than raised so the output logged before them is not
+    lost.
+    """
+    out, err = io.StringIO(), io.StringIO()
+    result = error = None
+    with _utils.capture_logs() as records, contextlib.redirect_stdout(
+        out
+    ), contextlib.redirect_stderr(err):
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            error = e
+    return result, error, records, out.getvalue(), err.getvalue()
+
+
+def _submit_to_worker(executor, func, *args, **kwargs):
+    """Submit func to a _mesh_process_pool; read it with _worker_result()."""
+    return executor.submit(_run_captured, func, *args, **kwargs)
+
+
+def _worker_result(future):
+    """Print a worker's captured output in this process, then return its result.
+
+    Going through the parent's print functions keeps the output in the log
+    batch and rich console instead of tearing the Live display.
+    """
+    result, error, records, stdout_text, stderr_text = future.result()
+    _utils.replay_logs(records)
+    # The tools also print() directly; treat that like any other info line
+    for line in stdout_text.splitlines():
+        print_base(line)
+    if stderr_text:
+        _utils.flush_logs()
+        sys.stderr.write(stderr_text)
+    if error is not None:
+        raise error
+    return result
 
 
 def simplify_mesh(input_file, output_file, target_reduction=0.95, combine_meshes=False):
@@ -66,12 +229,12 @@ def simplify_mesh(input_file, output_file, target_reduction=0.95, combine_meshes
             input_file (str): Path to input mesh file.
             output_file (str): Path to save simplified mesh file. Auto create if not exists.
             target_reduction (float): Fraction of original faces to remove (0.0-1.0).
+            combine_meshes (bool): Merge all sub-meshes into one before simplification.
 
     """
     print(f"Simplifying: {input_file}")
-    with _pymeshlab_lock:  # Serialize pymeshlab operations
+    with _pymeshlab_lock, _borrowed_meshset() as ms:  # Serialize pymeshlab operations
         try:
-            ms = pymeshlab.MeshSet()
             ms.load_new_mesh(input_file)
 
             target_percentage = 1.0 - target_reduction
@@ -85,22 +248,34 @@ def simplify_mesh(input_file, output_file, target_reduction=0.95, combine_meshes
                 print_warning(
                     f"Multiple meshes found in {input_file}.{combine_mesh_str}"
                 )
+                if combine_meshes:
+                    # Merge inside MeshLab so decimation and saving run once
+                    # instead of per sub-mesh (each of which would also
+                    # overwrite the same output file).
+                    ms.apply_filter(
+                        "generate_by_merging_visible_meshes",
+                        mergevisible=True,
+                        deletelayer=True,
+                        mergevertices=True,
+                    )
+
+            output_dir = os.path.dirname(output_file)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            split_outputs = len(ms) > 1 and not combine_meshes
+            base, ext = os.path.splitext(output_file)
 
             for i in range(len(ms)):
                 ms.set_current_mesh(i)
-                ms.apply_filter(
-                    "meshing_decimation_quadric_edge_collapse",
-                    targetperc=target_percentage,
-                    preservenormal=True,
-                )
-                output_dir = os.path.dirname(output_file)
-                if output_dir:
-                    os.makedirs(output_dir, exist_ok=True)
-
-                modified_output_file = output_file
-                if len(ms) > 1 and not combine_meshes:
-                    base, ext = os.path.splitext(output_file)
-                    modified_output_file = f"{base}_{i}{ext}"
+                # A plain format conversion (no reduction) skips the QEM pass
+                if target_percentage < 1.0:
+                    ms.apply_filter(
+                        "meshing_decimation_quadric_edge_collapse",
+                        targetperc=target_percentage,
+                        preservenormal=True,
+                    )
+
+                modified_output_file = f"{base}_{i}{ext}" if split_outputs else output_file
                 ms.save_current_mesh(modified_output_file)
 
                 print(f"Saved simplified mesh to: {modified_output_file}")
@@ -109,6 +284,41 @@ def simplify_mesh(input_file, output_file, target_reduction=0.95, combine_meshes
             raise RuntimeError(f"Mesh simplification failed for {input_file}.")
 
 
+def _count_dae_faces(mesh_file):
+    """
+    Count triangles in a COLLADA file by streaming its XML, without loading geometry.
+
+    <triangles> contribute their count attribute and <polylist> polygons
+    contribute (vertices - 2) triangles each, matching how they are
+    triangulated on import.
+
+    Args:
+            mesh_file (str): Path to DAE file
+
+    Returns:
+            int or None: Triangle count, or None if the file uses primitives
+                    (<polygons>, <tristrips>, <trifans>) that cannot be counted
+                    this way or is not well-formed XML
+    """
+    total = 0
+    try:
+        for _, elem in ET.iterparse(mesh_file, events=("end",)):
+            tag = elem.tag.rpartition("}")[2]
+            if tag == "triangles":
+                total += int(elem.get("count", "0"))
+            elif tag == "vcount":
+                # Child of <polylist>: one vertex count per polygon
+                counts = (elem.text or "").split()
+                total += sum(map(int, counts)) - 2 * len(counts)
+            elif tag in ("polygons", "tristrips", "trifans"):
+                return None
+            elem.clear()
+    except ET.ParseError:
+        # Leave files the strict XML parser rejects to pymeshlab's loader
+        return None
+    return total
+
+
 def count_mesh_faces(mesh_file):
     """
     Count the number of faces in a mesh file.
@@ -120,71 +330,87 @@ def count_mesh_faces(mesh_file):
     Returns:
             int: Number of faces in the mesh, or -1 if unable to determine
     """
-    if not os.path.exists(mesh_file):
+    # Keyed on mtime and size, so a rewritten mesh (e.g. after simplification)
+    # is counted again while unchanged ones hit the cache. Failures raise out
+    # of the cached helper, so they are retried (and reported) every time.
+    try:
+        st = os.stat(mesh_file)
+        return _count_mesh_faces_cached(mesh_file, st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
         print_warning(f"Mesh file not found: {mesh_file}")
-        return -1
+    except _FaceCountError as e:
+        print_warning(f"{e}: {mesh_file}")
+    except Exception as e:
+        print_warning(f"Error counting faces in {mesh_file}: {e}")
+    return -1
 
-    ext = os.path.splitext(mesh_file)[1].lower()
 
-    try:
-        if ext == ".stl":
-            # Try reading as binary STL first
-            with open(mesh_file, "rb") as f:
-                # Skip 80-byte header
-                f.read(80)
-                # Read number of triangles (uint32)
-                data = f.read(4)
-                if len(data) == 4:
-                    num_triangles = int.from_bytes(
-                        data, byteorder="little", signed=False
-                    )
-                    # Validate it's actually binary (check file size)
-                    expected_size = (
-                        80 + 4 + (num_triangles * 50)
-                    )  # header + count + (triangle data)
-                    actual_size = os.path.getsize(mesh_file)
-
-                    if abs(actual_size - expected_size) < 100:  # Allow small tolerance
-                        return num_triangles
-
-                # If binary read failed, try ASCII
-                f.seek(0)
-                content = f.read().decode("utf-8", errors="ignore")
-                # Count 'facet normal' occurrences in ASCII STL
-                face_count = content.lower().count("facet normal")
-                if face_count > 0:
-                    return face_count
-
-        elif ext == ".obj":
-            # Count faces in OBJ file (lines starting with 'f')
-            face_count = 0
-            with open(mesh_file, "r") as f:
-                for line in f:
-                    if line.strip().startswith("f "):
-                        face_count += 1
-            return face_count
-
-        elif ext == ".dae":
-            # DAE files are complex, use pymeshlab if available
-            if PYMESHLAB_AVAILABLE:
-                with _pymeshlab_lock:  # Serialize pymeshlab operations
-                    ms = pymeshlab.MeshSet()
-                    ms.load_new_mesh(mesh_file)
-                    total_faces = sum(ms.mesh(i).face_number() for i in range(len(ms)))
-                return total_faces
-            else:
-                print_warning(
-                    f"Cannot count faces in DAE file without pymeshlab: {mesh_file}"
-                )
-                return -1
+class _FaceCountError(RuntimeError):
+    """A mesh whose faces cannot be counted; the message says why."""
 
-        else:
-            print_warning(f"Unsupported file format for face counting: {ext}")
-            return -1
 
-    except Exception as e:
-        print_warning(f"Error counting faces in {mesh_file}: {e}")
-        return -1
+@functools.lru_cache(maxsize=4096)
+def _count_mesh_faces_cached(mesh_file, mtime_ns, size):
+    """Body of count_mesh_faces for one version of a file.
+
+    Raises instead of returning -1, so that lru_cache only keeps successes.
+    """
+    ext = os.path.splitext(mesh_file)[1].lower()
+
+    if ext == ".stl":
+        # Try reading as binary STL first
+        with open(mesh_file, "rb") as f:
+            # 80-byte header followed by the number of triangles (uint32)
+            data = f.read(84)
+            if len(data) == 84:
+                (num_triangles,) = struct.unpack_from("<I", data, 80)
+                # Validate it's actually binary (check file size)
+                expected_size = (
+                    80 + 4 + (num_triangles * 50)
+                )  # header + count + (triangle data)
+                if -100 < size - expected_size < 100:  # Allow small tolerance
+                    return num_triangles
+
+            # Only files that look like ASCII STL are read in full; a
+            # binary file with a bad triangle count is reported instead
+            if data.lstrip()[:5].lower() != b"solid":
+                raise _FaceCountError(
+                    "Malformed binary STL (triangle count does not match file size)"
+                )
+            f.seek(0)
+            content = f.read()
+        # Count facets in ASCII STL on the raw bytes, without decoding.
+        # Keywords are case-insensitive and files may mix cases; 'endfacet'
+        # is a single token, unlike 'facet normal', whose separator can be
+        # any whitespace.
+        face_count = len(_STL_ENDFACET_RE.findall(content))
+        if face_count == 0:
+            raise _FaceCountError("No facets found in ASCII STL")
+        return face_count
+
+    elif ext == ".obj":
+        # Count faces in OBJ file (lines starting with 'f') with a C-level
+        # bytes.count instead of a Python loop over every line
+        with open(mesh_file, "rb") as f:
+            content = f.read()
+        if b"\n " in content or b"\n\t" in content:
+            # Indented lines present: match them with the regex instead
+            return len(_OBJ_FACE_LINE_RE.findall(content))
+        return content.count(b"\nf ") + content.startswith(b"f ")
+
+    elif ext == ".dae":
+        # Read the primitive counts from the XML; only primitive types
+        # without a count attribute need a full pymeshlab load
+        total_faces = _count_dae_faces(mesh_file)
+        if total_faces is not None:
+            return total_faces
+        if not PYMESHLAB_AVAILABLE:
+            raise _FaceCountError("Cannot count faces in DAE file without pymeshlab")
+        with _pymeshlab_lock, _borrowed_meshset() as ms:
+            ms.load_new_mesh(mesh_file)
+            return sum(ms.mesh(i).face_number() for i in range(len(ms)))
+
+    raise _FaceCountError(f"Unsupported file format for face counting: {ext}")
 
 
 def validate_and_fix_mesh_faces(
@@ -206,13 +432,12 @@ def validate_and_fix_mesh_faces(
                     face_count (int): Current number of faces
                     suggested_target (int): Suggested target face count if reduction needed
     """
-    if not os.path.exists(mesh_file):
-        return False, 0, 0
-
+    # No separate exists() check: count_mesh_faces stats the file once and
+    # reports a missing one as -1 with a warning
     face_count = count_mesh_faces(mesh_file)
 
     if face_count < 0:
-        # Unable to determine face count
+        # Unable to determine face count (or the file is missing)
         return False, -1, 0
 
     if face_count > max_faces:
@@ -223,6 +448,26 @@ def validate_and_fix_mesh_faces(
     return False, face_count, 0
 
 
+_MESH_EXTENSIONS = (".stl", ".obj", ".dae")
+
+
+def _iter_mesh_files(directory):
+    """Yield mesh file paths under directory, recursively.
+
+    Walks with os.scandir so directory checks use the cached dirent type,
+    and matches extensions with one str.endswith per name.
+    """
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_mesh_files(entry.path)
+        elif entry.name.lower().endswith(_MESH_EXTENSIONS):
+            yield entry.path
+
+
 def validate_all_meshes_in_directory(mesh_dir, max_faces=200000, max_workers=None):
     """
     Scan all mesh files in a directory and report which ones exceed MuJoCo's face limit.
@@ -241,57 +486,43 @@ def validate_all_meshes_in_directory(mesh_dir, max_faces=200000, max_workers=Non
     if not os.path.exists(mesh_dir):
         return problematic_meshes
 
-    supported_extensions = [".stl", ".obj", ".dae"]
-
     # Collect all mesh files first
-    mesh_files = []
-    for root, dirs, files in os.walk(mesh_dir):
-        for filename in files:
-            ext = os.path.splitext(filename)[1].lower()
-            if ext in supported_extensions:
-                mesh_path = os.path.join(root, filename)
-                mesh_files.append(mesh_path)
+    mesh_files = list(_iter_mesh_files(mesh_dir))
 
     if not mesh_files:
         return problematic_meshes
 
-    # Determine worker count
+    # Face counts are header reads, byte scans or (DAE) a streaming XML parse,
+    # all cheap enough that threads beat the start-up cost of worker
+    # processes. Only DAEs using primitives without a count attribute need a
+    # pymeshlab load, which is serialized by _pymeshlab_lock.
     if max_workers is None:
-        max_workers = min(len(mesh_files), os.cpu_count() or 4)
+        max_workers = min(len(mesh_files), 16)
 
-    def _validate_single_mesh(mesh_path):
-        """Validate a single mesh file."""
-        needs_fix, face_count, suggested_target = validate_and_fix_mesh_faces(
-            mesh_path, max_faces
-        )
+    def _collect(mesh_path, result):
+        """Keep the result of one mesh if it needs fixing."""
+        needs_fix, face_count, suggested_target = result
         if needs_fix:
-            return (mesh_path, face_count, suggested_target)
-        return None
+            problematic_meshes.append((mesh_path, face_count, suggested_target))
 
-    # Process meshes in parallel
     if max_workers > 1 and len(mesh_files) > 1:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {
-                executor.submit(_validate_single_mesh, mesh_path): mesh_path
+                executor.submit(validate_and_fix_mesh_faces, mesh_path, max_faces): mesh_path
                 for mesh_path in mesh_files
             }
-
             for future in as_completed(futures):
+                mesh_path = futures[future]
                 try:
-                    result = future.result()
-                    if result:
-                        problematic_meshes.append(result)
+                    _collect(mesh_path, future.result())
                 except Exception as e:
-                    mesh_path = futures[future]
                     print_warning(
                         f"Error validating {os.path.basename(mesh_path)}: {e}"
                     )
     else:
         # Sequential processing fallback
         for mesh_path in mesh_files:
-            result = _validate_single_mesh(mesh_path)
-            if result:
-                problematic_meshes.append(result)
+            _collect(mesh_path, validate_and_fix_mesh_faces(mesh_path, max_faces))
 
     return problematic_meshes
 
@@ -330,92 +561,118 @@ def fix_oversized_meshes(
     if not problematic_meshes:
         return 0, 0
 
-    print_debug(
-        f"Found {len(problematic_meshes)} mesh(es) exceeding MuJoCo's {max_faces:,} face limit:"
-    )
-    for mesh_path, face_count, suggested_target in problematic_meshes:
+    # The thousands separators need an eager f-string, so skip it entirely
+    # unless debug output is on.
+    if _utils.DEBUG_ENABLED:
         print_debug(
-            f"  - {os.path.basename(mesh_path)}: {face_count:,} faces (target: {suggested_target:,})"
+            f"Found {len(problematic_meshes)} mesh(es) exceeding MuJoCo's {max_faces:,} face limit:"
         )
+        for mesh_path, face_count, suggested_target in problematic_meshes:
+            print_debug(
+                f"  - {os.path.basename(mesh_path)}: {face_count:,} faces (target: {suggested_target:,})"
+            )
 
     fixed_count = 0
     failed_count = 0
 
-    # Thread-safe counter locks
-    count_lock = Lock()
-
-    def _fix_single_mesh(mesh_info):
-        """Fix a single oversized mesh."""
-        nonlocal fixed_count, failed_count
-        mesh_path, face_count, suggested_target = mesh_info
-
-        try:
-            # Create backup if requested
-            if backup:
-                backup_path = mesh_path + ".bak"
-                if not os.path.exists(backup_path):
-                    shutil.copy2(mesh_path, backup_path)
-                    print_info(f"Created backup: {os.path.basename(backup_path)}")
+    def _report(mesh_path, new_face_count):
+        """Log the outcome of one simplification."""
+        nonlocal fixed_count
+        if new_face_count > 0 and new_face_count <= max_faces:
+            print_confirm(
+                f"✓ Successfully reduced {os.path.basename(mesh_path)} to {new_face_count:,} faces"
+            )
+        else:
+            print_warning(
+                f"⚠ {os.path.basename(mesh_path)} may still have issues (detected: {new_face_count:,} faces)"
+            )
+        fixed_count += 1  # Count as fixed even if verification is uncertain
 
+    # Backups are cheap copies; make them up front in this process
+    for mesh_path, face_count, suggested_target in problematic_meshes:
+        if backup:
+            backup_path = mesh_path + ".bak"
+            if not os.path.exists(backup_path):
+                shutil.copy2(mesh_path, backup_path)
+                print_info("Created backup: %s", os.path.basename(backup_path))
+        if _utils.DEBUG_ENABLED:
             print_debug(
                 f"Simplifying {os.path.basename(mesh_path)}: {face_count:,} → {suggested_target:,} faces"
             )
 
-            # Use simplify_mesh_tool with target_faces parameter (protected by lock)
-            with _pymeshlab_lock:
-                simplify_mesh_tool(
-                    mesh_path,
-                    mesh_path,  # Overwrite original
-                    target_reduction=None,
-                    target_faces=suggested_target,
-                )
-
-            # Verify the fix
-            new_face_count = count_mesh_faces(mesh_path)
-            if new_face_count > 0 and new_face_count <= max_faces:
-                print_confirm(
-                    f"✓ Successfully reduced {os.path.basename(mesh_path)} to {new_face_count:,} faces"
-                )
-                with count_lock:
-                    fixed_count += 1
-            else:
-                print_warning(
-                    f"⚠ {os.path.basename(mesh_path)} may still have issues (detected: {new_face_count:,} faces)"
-                )
-                with count_lock:
-                    fixed_count += 1  # Count as fixed even if verification is uncertain
-
-        except Exception as e:
-            print_error(f"✗ Failed to simplify {os.path.basename(mesh_path)}: {e}")
-            with count_lock:
-                failed_count += 1
-
     # Determine worker count
     if max_workers is None:
         max_workers = min(len(problematic_meshes), os.cpu_count() or 4)
 
-    # Process meshes in parallel
+    # Simplification is CPU-bound and pymeshlab is not thread-safe, so threads
+    # would just queue on _pymeshlab_lock; worker processes run it in parallel.
     if max_workers > 1 and len(problematic_meshes) > 1:
-        print_debug(f"Fixing meshes with {max_workers} parallel workers...")
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [
-                executor.submit(_fix_single_mesh, mesh_info)
-                for mesh_info in problematic_meshes
-            ]
+        print_debug("Fixing meshes with %s worker processes...", max_workers)
+        with _mesh_process_pool(max_workers) as executor:
+            futures = {
+                _submit_to_worker(
+                    executor, _simplify_oversized_mesh, mesh_path, suggested_target
+                ): mesh_path
+                for mesh_path, _, suggested_target in problematic_meshes
+            }
 
             for future in as_completed(futures):
+                mesh_path = futures[future]
                 try:
-                    future.result()
+                    _report(mesh_path, _worker_result(future))
                 except Exception as e:
-                    print_error(f"Unexpected error during parallel mesh fixing: {e}")
+                    print_error(f"✗ Failed to simplify {os.path.basename(mesh_path)}: {e}")
+                    failed_count += 1
     else:
         # Sequential processing fallback
-        for mesh_info in problematic_meshes:
-            _fix_single_mesh(mesh_info)
+        for mesh_path, _, suggested_target in problematic_meshes:
+            try:
+                with _pymeshlab_lock:
+                    new_face_count = _simplify_oversized_mesh(mesh_path, suggested_target)
+                _report(mesh_path, new_face_count)
+            except Exception as e:
+                print_error(f"✗ Failed to simplify {os.path.basename(mesh_path)}: {e}")
+                failed_count += 1
 
     return fixed_count, failed_count
 
 
+def _break_hardlink(path):
+    """Give *path* its own inode so in-place edits cannot reach other links.
+
+    Output meshes may be hardlinked to the source files (--hardlink-meshes);
+    rewriting one of those in place would silently modify the user's mesh.
+    """
+    if os.stat(path).st_nlink > 1:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.copy2(path, tmp_path)
+        os.replace(tmp_path, path)
+
+
+def _simplify_oversized_mesh(mesh_path, target_faces):
+    """
+    Simplify one mesh in place down to target_faces and return its new face count.
+    Module-level so it can run in a worker process of fix_oversized_meshes.
+
+    Args:
+            mesh_path (str): Mesh file to overwrite
+            target_faces (int): Target number of faces
+
+    Returns:
+            int: Face count after simplification, or -1 if unable to determine
+    """
+    _break_hardlink(mesh_path)
+    # The tool reports the saved mesh's face count, so the file is not re-read
+    with _borrowed_meshset() as ms:
+        return simplify_mesh_tool(
+            mesh_path,
+            mesh_path,  # Overwrite original
+            target_reduction=None,
+            target_faces=target_faces,
+            ms=ms,
+        )[1]
+
+
 def copy_mesh_files(
     absolute_mesh_paths,
     output_dir,
@@ -430,6 +687,7 @@ def copy_mesh_files(
     simplify_collision_params=None,
     raise_on_error=True,
     max_workers=None,
+    link_passthrough=False,
 ):
     """
     Copy mesh files to output dir with parallel processing support.
@@ -457,6 +715,8 @@ def copy_mesh_files(
                 Falls back to simplify_params when None.
             raise_on_error: Whether to raise exceptions on errors
             max_workers: Maximum number of parallel workers (None = auto-detect based on CPU count)
+            link_passthrough: Hardlink STL/OBJ files that will not be simplified instead
+                    of copying them (falls back to a copy across filesystems)
 
     Returns:
             tuple: (material_info, inertia_data)
@@ -528,6 +788,10 @@ def copy_mesh_files(
 
     output_mesh_dir = os.path.join(output_dir, mesh_dir) if mesh_dir else output_dir
     os.makedirs(output_mesh_dir, exist_ok=True)
+    # Create every output directory up front rather than once per mesh
+    collision_dir = os.path.join(output_mesh_dir, "collision")
+    if generate_collision and GENERATE_COLLISION_AVAILABLE:
+        os.makedirs(collision_dir, exist_ok=True)
 
     # Simplification result counters (thread-safe via simplify_lock)
     simplify_lock = Lock()
@@ -537,13 +801,11 @@ def copy_mesh_files(
     }
 
     SUPPORTED_FORMATS = {".stl", ".obj"}
-    CONVERTIBLE_FORMATS = {".dae"}
 
     # Counters for statistics (access protected by counter_lock)
-    copied_count = 0
-    converted_count = 0
-    ignored_count = 0
-    deduplicated_count = 0
+    _counts = {
+        "copied": 0, "converted": 0, "ignored": 0, "deduplicated": 0, "unchanged": 0,
+    }
 
     # Hash-based deduplication: tracks {md5_hash: canonical_dest_filename}.
     # When a source file is identical (same MD5) to one already copied, we skip
@@ -551,8 +813,241 @@ def copy_mesh_files(
     # e.g. the 10 identically-named copies of synapticon_jd12_visual.stl into a
     # single file on disk and ensures the MJCF references one shared mesh asset.
     _hash_to_canonical: dict = {}
+    # {source path: Future of its md5} so repeated references to one file are
+    # hashed once, even when threads reach it at the same time
+    _src_hashes: dict = {}
     _hash_registry_lock = Lock()
 
+    # Source meshes usually sit in a few shared folders; list each folder once
+    # instead of stat()ing every file (a big win on network filesystems).
+    _source_dirs = set()
+    for _mesh_path in absolute_mesh_paths.values():
+        for _mesh_type in ("visual", "collision"):
+            if _mesh_type not in _mesh_path:
+                continue
+            _srcs = _mesh_path[_mesh_type]["from"]
+            for _src in [_srcs] if isinstance(_srcs, str) else _srcs:
+                _source_dirs.add(os.path.dirname(_src))
+    _existing_sources = set()
+    for _dir in _source_dirs:
+        try:
+            with os.scandir(_dir) as it:
+                _existing_sources.update(os.path.join(_dir, e.name) for e in it)
+        except OSError:
+            pass
+
+    # Make-style skip for re-runs: {dest_name: record} from the previous run.
+    # A mesh is reused when its source stat, simplify settings and the output
+    # file itself all match the record.
+    _cache_path = os.path.join(output_mesh_dir, _MESH_CACHE_NAME)
+    try:
+        with open(_cache_path) as f:
+            _previous_records = json.load(f)
+    except (OSError, ValueError):
+        _previous_records = {}
+    _records: dict = {}
+    _records_lock = Lock()
+    # {dest_path: source signature} of meshes written this run
+    _pending_records: dict = {}
+    # Output paths reused unchanged from the previous run
+    _unchanged_dests: set = set()
+
+    def _simplify_settings(mesh_type_name):
+        """Return (do_simplify, params) for a mesh type.
+
+        Collision meshes use simplify_collision_meshes / simplify_collision_params
+        when set; otherwise they fall through to the same simplify_meshes logic
+        as visual.
+        """
+        if mesh_type_name == "collision" and simplify_collision_meshes:
+            return (
+                SIMPLIFY_MESH_TOOL_AVAILABLE,
+                simplify_collision_params or simplify_params or {},
+            )
+        return simplify_meshes and SIMPLIFY_MESH_TOOL_AVAILABLE, simplify_params or {}
+
+    def _source_signature(src, mesh_type):
+        """Describe everything that determines the output for *src*."""
+        st = os.stat(src)
+        do_simplify, params = _simplify_settings(mesh_type)
+        return {
+            "src": os.path.realpath(src),
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "simplify": repr(sorted(params.items())) if do_simplify else None,
+        }
+
+    def _reuse_if_unchanged(dest_name, dest_path, signature):
+        """Keep the previous run's output for *dest_name* if nothing changed."""
+        record = _previous_records.get(dest_name)
+        if not record or record.get("source") != signature:
+            return False
+        try:
+            st = os.stat(dest_path)
+        except OSError:
+            return False
+        if (st.st_mtime_ns, st.st_size) != (record.get("mtime_ns"), record.get("size")):
+            return False
+        _unchanged_dests.add(dest_path)
+        with _records_lock:
+            _records[dest_name] = record
+        return True
+
+    def _try_hardlink(src, dst):
+        """Hardlink *src* to *dst*, returning False if that is not possible."""
+        try:
+            if os.path.lexists(dst):
+                os.remove(dst)
+            os.link(src, dst)
+            return True
+        except OSError:
+            return False
+
+    # {canonical_dest_filename: Event} set once the canonical file is written,
+    # so a duplicate never hardlinks a file that is still being copied.
+    _canonical_ready: dict = {}
+    # {hardlinked_dest_path: canonical_dest_path}; the mesh tools treat both
+    # names as one file so identical meshes are only simplified once.
+    _linked_to_canonical: dict = {}
+
+    def _link_if_duplicate(src, src_name, dest_name, mesh_type):
+        """Hardlink *dest_name* to an identical mesh that is already claimed.
+
+        Returns:
+            tuple: (deduplicated, ready). When not deduplicated, the caller now
+            owns *dest_name* as the canonical copy and must set *ready* once it
+            has been written.
+        """
+        # Links often share one source path (mirrored left/right parts);
+        # read and hash each path only once per run. The first thread to
+        # claim a path hashes it; the others wait on its future.
+        with _hash_registry_lock:
+            hash_future = _src_hashes.get(src)
+            owns_hash = hash_future is None
+            if owns_hash:
+                hash_future = _src_hashes[src] = Future()
+        if owns_hash:
+            try:
+                hash_future.set_result(_compute_file_hash(src))
+            except BaseException as e:
+                hash_future.set_exception(e)
+        src_hash = hash_future.result()
+        with _hash_registry_lock:
+            canonical_name = _hash_to_canonical.get(src_hash)
+            if canonical_name is None:
+                _hash_to_canonical[src_hash] = dest_name
+                ready = _canonical_ready[dest_name] = Event()
+                return False, ready
+            ready = _canonical_ready[canonical_name]
+        ready.wait()
+        with counter_lock:
+            _counts["deduplicated"] += 1
+        print_debug(
+            "Deduplicating '%s' mesh '%s' "
+            "→ hardlinking to '%s' (identical content, MD5=%.8s…)",
+            mesh_type,
+            src_name,
+            canonical_name,
+            src_hash,
+        )
+        # Hardlink canonical → dest_name so MJCF refs resolve correctly.
+        canonical_path = os.path.join(output_mesh_dir, canonical_name)
+        dedup_dest = os.path.join(output_mesh_dir, dest_name)
+        if dest_name != canonical_name:
+            # A leftover from an earlier run may be a stale, unlinked file
+            if os.path.exists(dedup_dest) and not os.path.samefile(
+                canonical_path, dedup_dest
+            ):
+                os.remove(dedup_dest)
+            if not os.path.exists(dedup_dest):
+                try:
+                    os.link(canonical_path, dedup_dest)
+                except OSError:
+                    _copy_mesh_file(canonical_path, dedup_dest)
+            if os.path.samefile(canonical_path, dedup_dest):
+                _linked_to_canonical[dedup_dest] = canonical_path
+        return True, None
+
+    def _copy_passthrough(src, modified_dest, mesh_type):
+        """Copy (or hardlink) an STL/OBJ source, including already-extracted DAE meshes."""
+        # Acquire the per-dest lock so concurrent threads for the same output
+        # file (multiple links sharing a mesh) don't interleave copy/simplify.
+        with _get_dest_lock(modified_dest):
+            try:
+                # Never write through a link left by an earlier
+                # --hardlink-meshes run; that would edit the source.
+                if os.path.exists(modified_dest) and os.path.samefile(
+                    src, modified_dest
+                ):
+                    os.remove(modified_dest)
+                if not (
+                    link_passthrough
+                    and not _simplify_settings(mesh_type)[0]
+                    and _try_hardlink(src, modified_dest)
+                ):
+                    _copy_mesh_file(src, modified_dest)
+                with counter_lock:
+                    _counts["copied"] += 1
+                print_debug(
+                    "Copied '%s' mesh '%s' to '%s'.",
+                    mesh_type,
+                    os.path.basename(src),
+                    os.path.basename(modified_dest),
+                )
+            except Exception as e:
+                print_warning(f"Could not copy mesh from '{src}'. Error: {e}")
+                raise RuntimeError(
+                    f"Failed to copy mesh from '{src}' to '{modified_dest}'."
+                )
+        return True
+
+    def _convert_dae(src, modified_dest, mesh_type):
+        """Convert a DAE that was not extracted during preprocessing (fallback case).
+
+        Returns False when the mesh was ignored.
+        """
+        # This shouldn't happen if preprocessing worked correctly
+        if not PYMESHLAB_AVAILABLE:
+            print_error(
+                f"pymeshlab not available. Cannot convert '{src}' from DAE to STL. Ignoring."
+            )
+            raise RuntimeError(
+                "pymeshlab is required for DAE to STL conversion but is not installed."
+            )
+        try:
+            # Use reduction=0.0 here to preserve all faces; the
+            # caller's simplify_params (target_faces) will handle
+            # any needed reduction afterwards.
+            _run_mesh_tool(simplify_mesh, src, modified_dest, 0.0)
+            print_debug(
+                "-> Converted '%s' mesh:\n\tFrom: '%s' (DAE)\n\tTo: '%s' (%s)",
+                mesh_type,
+                src,
+                modified_dest,
+                os.path.splitext(modified_dest)[1][1:].upper(),
+            )
+            with counter_lock:
+                _counts["converted"] += 1
+            return True
+        except Exception as e:
+            print_warning(
+                f"Could not convert mesh from '{src}' (DAE to STL). Error: {e}"
+            )
+            if raise_on_error:
+                raise RuntimeError(
+                    f"Failed to convert mesh from '{src}' to '{modified_dest}'."
+                )
+            with counter_lock:
+                _counts["ignored"] += 1
+            return False
+
+    # One lookup per mesh picks the handler for its source format
+    _format_handlers = {
+        ".stl": _copy_passthrough,
+        ".obj": _copy_passthrough,
+        ".dae": _convert_dae,
+    }
+
     def _copy_with_conflict_check(mesh_type, srcs, dsts, link_name):
         """Copy or convert meshes.
 
@@ -561,8 +1056,6 @@ def copy_mesh_files(
 
         Returns: List of dicts with material info for each mesh (empty for now).
         """
-        nonlocal copied_count, converted_count, ignored_count, deduplicated_count
-
         is_valid = isinstance(srcs, list) and isinstance(dsts, list)
         is_valid |= isinstance(srcs, str) and isinstance(dsts, str)
 
@@ -582,13 +1075,16 @@ def copy_mesh_files(
             src_ext = os.path.splitext(src_name)[1].lower()
             dest_name = os.path.basename(dst)
             dest_ext = os.path.splitext(dest_name)[1].lower()
+            modified_dest = os.path.join(output_mesh_dir, dest_name)
 
-            if not os.path.exists(src):
+            # Fall back to a stat for paths spelled differently from the listing
+            if src not in _existing_sources and not os.path.exists(src):
                 print_warning(f"Source mesh file '{src}' does not exist. Ignoring.")
                 if raise_on_error:
                     raise RuntimeError(f"Source mesh file '{src}' does not exist.")
                 else:
-                    ignored_count += 1
+                    with counter_lock:
+                        _counts["ignored"] += 1
                 return mesh_materials
 
             if dest_ext not in SUPPORTED_FORMATS:
@@ -596,125 +1092,114 @@ def copy_mesh_files(
                     f"Destination mesh format '{dest_ext}' not supported for '{src}'->'{dst}'."
                 )
 
-            if src_ext in SUPPORTED_FORMATS:
-                # --- Hash-based deduplication ---
-                # Compute MD5 of the source file and check if we already copied an
-                # identical file.  The URDF was already preprocessed to reference
-                # dest_name, so we must still create dest_name in the output dir.
-                # We hardlink to the canonical file to avoid redundant disk usage.
-                src_hash = _compute_file_hash(src)
-                with _hash_registry_lock:
-                    if src_hash in _hash_to_canonical:
-                        canonical_name = _hash_to_canonical[src_hash]
-                        with counter_lock:
-                            deduplicated_count += 1
-                        print_debug(
-                            f"Deduplicating '{mesh_type}' mesh '{src_name}' "
-                            f"→ hardlinking to '{canonical_name}' (identical content, MD5={src_hash[:8]}…)"
-                        )
-                        # Hardlink canonical → dest_name so MJCF refs resolve correctly.
-                        canonical_path = os.path.join(output_mesh_dir, canonical_name)
-                        dedup_dest = os.path.join(output_mesh_dir, dest_name)
-                        if dest_name != canonical_name and not os.path.exists(dedup_dest):
-                            try:
-                                os.link(canonical_path, dedup_dest)
-                            except OSError:
-                                shutil.copy2(canonical_path, dedup_dest)
-                        mesh_materials.append(
-                            {"file": dest_name, "material": None, "rgba": None}
-                        )
-                        continue
-                    else:
-                        _hash_to_canonical[src_hash] = dest_name
-                # --- End deduplication ---
-
-                # Direct copy of STL/OBJ files (including already-extracted DAE meshes).
-                # Acquire the per-dest lock so concurrent threads for the same output
-                # file (multiple links sharing a mesh) don't interleave copy/simplify.
-                modified_dest = os.path.join(output_mesh_dir, dest_name)
-                with _get_dest_lock(modified_dest):
-                    try:
-                        shutil.copy2(src, modified_dest)
+            # --- Hash-based deduplication ---
+            # Identical sources (same MD5) are written, and converted, only
+            # once. The URDF was already preprocessed to reference dest_name,
+            # so we must still create dest_name in the output dir; we hardlink
+            # it to the canonical file to avoid redundant disk usage.
+            ready = None
+            if src_ext in _format_handlers:
+                deduplicated, ready = _link_if_duplicate(
+                    src, src_name, dest_name, mesh_type
+                )
+                if deduplicated:
+                    mesh_materials.append(
+                        {"file": dest_name, "material": None, "rgba": None}
+                    )
+                    continue
+            # --- End deduplication ---
+
+            try:
+                if ready is not None:
+                    signature = _source_signature(src, mesh_type)
+                    if _reuse_if_unchanged(dest_name, modified_dest, signature):
                         with counter_lock:
-                            copied_count += 1
+                            _counts["unchanged"] += 1
                         mesh_materials.append(
                             {"file": dest_name, "material": None, "rgba": None}
                         )
                         print_debug(
-                            f"Copied '{mesh_type}' mesh '{src_name}' to '{dest_name}'."
-                        )
-                    except Exception as e:
-                        print_warning(f"Could not copy mesh from '{src}'. Error: {e}")
-                        raise RuntimeError(
-                            f"Failed to copy mesh from '{src}' to '{modified_dest}'."
+                            "Reusing unchanged '%s' mesh '%s'.", mesh_type, dest_name
                         )
+                        continue
+                    _pending_records[modified_dest] = signature
 
-            elif src_ext in CONVERTIBLE_FORMATS:
-                # DAE files that weren't extracted (fallback case)
-                # This shouldn't happen if preprocessing worked correctly
-                if not PYMESHLAB_AVAILABLE:
-                    print_error(
-                        f"pymeshlab not available. Cannot convert '{src}' from DAE to STL. Ignoring."
-                    )
-                    raise RuntimeError(
-                        "pymeshlab is required for DAE to STL conversion but is not installed."
-                    )
-                try:
-                    modified_dest = os.path.join(output_mesh_dir, dest_name)
-                    # Use reduction=0.0 here to preserve all faces; the
-                    # caller's simplify_params (target_faces) will handle
-                    # any needed reduction afterwards.
-                    simplify_mesh(src, modified_dest, 0.0)
-                    print_debug(
-                        f"-> Converted mesh:\n\tFrom: '{src}' ({src_ext.upper()})\n\tTo: '{modified_dest}' ({dest_ext.upper()})"
-                    )
-                    with counter_lock:
-                        converted_count += 1
-                    mesh_materials.append(
-                        {"file": dest_name, "material": None, "rgba": None}
-                    )
-                    print_debug(
-                        f"Copied '{mesh_type}' mesh '{src_name}' to '{dest_name}'."
-                    )
-                except Exception as e:
+                handler = _format_handlers.get(src_ext)
+                if handler is None:
                     print_warning(
-                        f"Could not convert mesh from '{src}' (DAE to STL). Error: {e}"
+                        f"Unsupported mesh format '{src_ext}' for file '{src_name}'. Ignoring."
                     )
                     if raise_on_error:
                         raise RuntimeError(
-                            f"Failed to convert mesh from '{src}' to '{modified_dest}'."
+                            f"Unsupported mesh format '{src_ext}' for file '{src_name}'."
                         )
                     else:
                         with counter_lock:
-                            ignored_count += 1
-            else:
-                print_warning(
-                    f"Unsupported mesh format '{src_ext}' for file '{os.path.basename(src)}'. Ignoring."
-                )
-                if raise_on_error:
-                    raise RuntimeError(
-                        f"Unsupported mesh format '{src_ext}' for file '{os.path.basename(src)}'."
+                            _counts["ignored"] += 1
+                elif handler(src, modified_dest, mesh_type):
+                    mesh_materials.append(
+                        {"file": dest_name, "material": None, "rgba": None}
                     )
-                else:
-                    with counter_lock:
-                        ignored_count += 1
+            finally:
+                if ready is not None:
+                    ready.set()
 
         return mesh_materials
 
+    # Set below when the CPU-bound mesh tools run in worker processes
+    mesh_pool = None
+    # (canonical_path, reduction, target_faces, translation, scale) of every
+    # simplification already applied; hardlinked duplicates share the result.
+    _simplified_keys: set = set()
+
+    def _run_mesh_tool(func, *args, **kwargs):
+        """Run a mesh tool in a worker process if the pool is active.
+
+        The calling thread just waits on the result, so meshes from different
+        links are processed on separate cores instead of contending for the GIL.
+        """
+        if mesh_pool is not None:
+            return _worker_result(
+                _submit_to_worker(mesh_pool, func, *args, **kwargs)
+            )
+        return func(*args, **kwargs)
+
     def _apply_mesh_tools(mesh_file_path, link_name, mesh_type_name):
         """Apply optional mesh tools to processed mesh files."""
         if not os.path.exists(mesh_file_path):
             return
 
         # Determine which simplification settings to use for this mesh type.
-        # Collision meshes use simplify_collision_meshes / simplify_collision_params when
-        # set; otherwise they fall through to the same simplify_meshes logic as visual.
-        if mesh_type_name == "collision" and simplify_collision_meshes:
-            _do_simplify = SIMPLIFY_MESH_TOOL_AVAILABLE
-            _active_params = simplify_collision_params or simplify_params or {}
-        else:
-            _do_simplify = simplify_meshes and SIMPLIFY_MESH_TOOL_AVAILABLE
-            _active_params = simplify_params or {}
+        _do_simplify, _active_params = _simplify_settings(mesh_type_name)
+
+        # Hardlinked duplicates share the canonical file's inode, so lock and
+        # key on the canonical path: the same bytes are never simplified twice
+        # with the same settings, or by two threads at once.
+        canonical_path = _linked_to_canonical.get(mesh_file_path, mesh_file_path)
+        # Cleared when a tool fails, so the output is not recorded as finished
+        tools_ok = True
+        # Reused outputs were already simplified with these settings last run
+        unchanged = canonical_path in _unchanged_dests
+        if _do_simplify and unchanged:
+            _do_simplify = False
+        if _do_simplify:
+            simplify_key = (
+                canonical_path,
+                _active_params.get("reduction"),
+                _active_params.get("target_faces"),
+                repr(_active_params.get("translation")),
+                repr(_active_params.get("scale")),
+            )
+            with simplify_lock:
+                already_simplified = simplify_key in _simplified_keys
+                _simplified_keys.add(simplify_key)
+            if already_simplified:
+                print_debug(
+                    "-> %s mesh '%s' shares an already simplified file, skipping",
+                    mesh_type_name.capitalize(),
+                    os.path.basename(mesh_file_path),
+                )
+                _do_simplify = False
 
         # Apply mesh simplification if requested
         if _do_simplify:
@@ -725,43 +1210,40 @@ def copy_mesh_files(
                 scale = _active_params.get("scale", None)
 
                 print_debug(
-                    f"Checking {mesh_type_name} mesh for link '{link_name}': {os.path.basename(mesh_file_path)}"
+                    "Checking %s mesh for link '%s': %s",
+                    mesh_type_name,
+                    link_name,
+                    os.path.basename(mesh_file_path),
                 )
                 # Hold the per-file lock for the entire trimesh-read + pymeshlab
                 # simplification sequence so that a concurrent thread cannot overwrite
                 # the file (via shutil.copy2) while we have it open.
-                with _get_dest_lock(mesh_file_path):
-                    _mesh_faces_before = None
-                    try:
-                        import trimesh as _tm_check
-                        _mesh_faces_before = len(_tm_check.load(mesh_file_path, process=False).faces)
-                    except Exception:
-                        pass
-                    with _pymeshlab_lock:
-                        simplify_mesh_tool(
-                            mesh_file_path,
-                            mesh_file_path,
-                            reduction,
-                            target_faces,
-                            translation,
-                            scale,
+                with _get_dest_lock(canonical_path):
+                    simplify_args = (
+                        mesh_file_path,
+                        mesh_file_path,
+                        reduction,
+                        target_faces,
+                        translation,
+                        scale,
+                    )
+                    # Both counts come from the tool, so they are triangle
+                    # counts from the same loader (an OBJ's own face lines
+                    # may be quads or n-gons)
+                    if mesh_pool is not None:
+                        _mesh_faces_before, _mesh_faces_after = _run_mesh_tool(
+                            _simplify_with_tool, *simplify_args
                         )
-                    _mesh_faces_after = None
-                    try:
-                        import trimesh as _tm_check
-                        _mesh_faces_after = len(_tm_check.load(mesh_file_path, process=False).faces)
-                    except Exception:
-                        pass
+                    else:
+                        with _pymeshlab_lock:
+                            _mesh_faces_before, _mesh_faces_after = _simplify_with_tool(
+                                *simplify_args
+                            )
 
                 _count_key_simplified = f"{mesh_type_name}_simplified"
                 _count_key_skipped = f"{mesh_type_name}_skipped"
 
-                actually_simplified = (
-                    _mesh_faces_before is not None
-                    and _mesh_faces_after is not None
-                    and _mesh_faces_after < _mesh_faces_before
-                )
-                if actually_simplified:
+                if _mesh_faces_after < _mesh_faces_before:
                     with simplify_lock:
                         _simplify_counts[_count_key_simplified] += 1
                     print_confirm(
@@ -773,13 +1255,17 @@ def copy_mesh_files(
                         _simplify_counts[_count_key_skipped] += 1
                     _reason = (
                         f"{_mesh_faces_before} faces ≤ target {target_faces}"
-                        if target_faces is not None and _mesh_faces_before is not None
+                        if target_faces is not None
                         else "no reduction needed"
                     )
                     print_debug(
-                        f"-> Skipped {mesh_type_name} mesh '{os.path.basename(mesh_file_path)}': {_reason}"
+                        "-> Skipped %s mesh '%s': %s",
+                        mesh_type_name,
+                        os.path.basename(mesh_file_path),
+                        _reason,
                     )
             except Exception as e:
+                tools_ok = False
                 print_warning(
                     f"Failed to simplify {mesh_type_name} mesh '{mesh_file_path}': {e}"
                 )
@@ -791,27 +1277,34 @@ def copy_mesh_files(
             and GENERATE_COLLISION_AVAILABLE
         ):
             try:
-                collision_dir = os.path.join(output_mesh_dir, "collision")
-                os.makedirs(collision_dir, exist_ok=True)
                 collision_file = os.path.join(
                     collision_dir, os.path.basename(mesh_file_path)
                 )
 
-                print_info(
-                    f"Generating collision mesh for link '{link_name}': {os.path.basename(mesh_file_path)}"
-                )
-                success = generate_collision_mesh(
-                    mesh_file_path, collision_dir, visualize=False
-                )
-                if success:
-                    print_confirm(
-                        f"-> Generated collision mesh: {os.path.basename(collision_file)}"
+                if unchanged and os.path.exists(collision_file):
+                    print_debug(
+                        "Reusing collision mesh '%s'.", os.path.basename(collision_file)
                     )
                 else:
-                    print_warning(
-                        f"Failed to generate collision mesh for '{mesh_file_path}'"
+                    print_info(
+                        "Generating collision mesh for link '%s': %s",
+                        link_name,
+                        os.path.basename(mesh_file_path),
                     )
+                    success = _run_mesh_tool(
+                        generate_collision_mesh, mesh_file_path, collision_dir, visualize=False
+                    )
+                    if success:
+                        print_confirm(
+                            f"-> Generated collision mesh: {os.path.basename(collision_file)}"
+                        )
+                    else:
+                        tools_ok = False
+                        print_warning(
+                            f"Failed to generate collision mesh for '{mesh_file_path}'"
+                        )
             except Exception as e:
+                tools_ok = False
                 print_warning(
                     f"Failed to generate collision mesh for '{mesh_file_path}': {e}"
                 )
@@ -834,10 +1327,19 @@ def copy_mesh_files(
                     orientation = None
 
                     print_info(
-                        f"Calculating inertia for {mesh_type_name} mesh of link '{link_name}': {os.path.basename(mesh_file_path)} (scale: {scale})"
+                        "Calculating inertia for %s mesh of link '%s': %s (scale: %s)",
+                        mesh_type_name,
+                        link_name,
+                        os.path.basename(mesh_file_path),
+                        scale,
                     )
-                    calculated_inertia = calculate_inertia(
-                        mesh_file_path, link_mass, translation, orientation, scale
+                    calculated_inertia = _run_mesh_tool(
+                        calculate_inertia,
+                        mesh_file_path,
+                        link_mass,
+                        translation,
+                        orientation,
+                        scale,
                     )
 
                     if calculated_inertia:
@@ -849,10 +1351,12 @@ def copy_mesh_files(
                         )
                         print_urdf_inertia(calculated_inertia)
                     else:
+                        tools_ok = False
                         print_warning(
                             f"Failed to calculate inertia for '{mesh_file_path}'"
                         )
                 except Exception as e:
+                    tools_ok = False
                     print_warning(
                         f"Failed to calculate inertia for '{mesh_file_path}': {e}"
                     )
@@ -869,95 +1373,121 @@ def copy_mesh_files(
                 f"Inertia calculation requested but no link properties provided. Skipping for link '{link_name}'."
             )
 
+        # Record the finished output so the next run can reuse it. After a
+        # failure the record is dropped instead: its signature would match on
+        # the next run and keep the unprocessed output forever.
+        if not tools_ok:
+            _pending_records.pop(mesh_file_path, None)
+            return
+        signature = _pending_records.get(mesh_file_path)
+        if signature is not None:
+            st = os.stat(mesh_file_path)
+            with _records_lock:
+                _records[os.path.basename(mesh_file_path)] = {
+                    "source": signature,
+                    "mtime_ns": st.st_mtime_ns,
+                    "size": st.st_size,
+                }
+
     def _process_link_mesh(link, mesh_path):
         """Process meshes for a single link (visual and/or collision)."""
         # Some meshes dont have visual or collision, skip those
         if len(mesh_path) == 0:
             return
+        # Each link's progress lines are written as one block
+        with _utils.log_batch():
+            _process_link_mesh_batched(link, mesh_path)
 
+    def _process_link_mesh_batched(link, mesh_path):
+        """Body of _process_link_mesh, run inside a log batch."""
         # Initialize material info for this link (thread-safe)
         with material_lock:
             if link not in material_info:
                 material_info[link] = {}
 
-        if "visual" in mesh_path:
-            visual_src = mesh_path["visual"]["from"]
-            visual_dst = mesh_path["visual"]["to"]
+        for mesh_type_name in ("visual", "collision"):
+            if mesh_type_name not in mesh_path:
+                continue
+            src = mesh_path[mesh_type_name]["from"]
+            dst = mesh_path[mesh_type_name]["to"]
             print_debug(
-                f"Processing 'visual' mesh for link '{link}':\n\tFrom: {visual_src}\n\tTo: {visual_dst}"
+                "Processing '%s' mesh for link '%s':\n\tFrom: %s\n\tTo: %s",
+                mesh_type_name,
+                link,
+                src,
+                dst,
             )
-            visual_materials = _copy_with_conflict_check(
-                "visual", srcs=visual_src, dsts=visual_dst, link_name=link
+            materials = _copy_with_conflict_check(
+                mesh_type_name, srcs=src, dsts=dst, link_name=link
             )
 
-            # Store material info for visual meshes (thread-safe)
-            if visual_materials:
+            # Only visual meshes carry material info (thread-safe)
+            if mesh_type_name == "visual" and materials:
                 with material_lock:
-                    material_info[link]["visual"] = visual_materials
-
-            # Apply mesh tools to visual meshes
-            if isinstance(visual_dst, list):
-                for dst_file in visual_dst:
-                    final_dst = os.path.join(
-                        output_mesh_dir, os.path.basename(dst_file)
-                    )
-                    _apply_mesh_tools(final_dst, link, "visual")
-            else:
-                final_dst = os.path.join(output_mesh_dir, os.path.basename(visual_dst))
-                _apply_mesh_tools(final_dst, link, "visual")
-
-        if "collision" in mesh_path:
-            collision_src = mesh_path["collision"]["from"]
-            collision_dst = mesh_path["collision"]["to"]
-            print_debug(
-                f"Processing 'collision' mesh for link '{link}':\n\tFrom: {collision_src}\n\tTo: {collision_dst}"
-            )
-            # Collision meshes don't need material info, so we don't store the return value
-            _copy_with_conflict_check(
-                "collision", srcs=collision_src, dsts=collision_dst, link_name=link
-            )
+                    material_info[link]["visual"] = materials
 
-            # Apply mesh tools to collision meshes (excluding collision generation since it's already collision)
-            if isinstance(collision_dst, list):
-                for dst_file in collision_dst:
-                    final_dst = os.path.join(
-                        output_mesh_dir, os.path.basename(dst_file)
-                    )
-                    _apply_mesh_tools(final_dst, link, "collision")
-            else:
-                final_dst = os.path.join(
-                    output_mesh_dir, os.path.basename(collision_dst)
-                )
-                _apply_mesh_tools(final_dst, link, "collision")
+            # Apply mesh tools to every output file, resolved once per file
+            # (collision generation only runs for visual meshes)
+            for dst_file in dst if isinstance(dst, list) else (dst,):
+                final_dst = os.path.join(output_mesh_dir, os.path.basename(dst_file))
+                _apply_mesh_tools(final_dst, link, mesh_type_name)
 
     # Process all links in parallel
     if max_workers is None:
         max_workers = min(len(absolute_mesh_paths), os.cpu_count() or 4)
 
     if max_workers > 1 and len(absolute_mesh_paths) > 1:
-        print_debug(f"Processing meshes with {max_workers} parallel workers...")
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all link processing tasks
-            futures = {
-                executor.submit(_process_link_mesh, link, mesh_path): link
-                for link, mesh_path in absolute_mesh_paths.items()
-            }
-
-            # Wait for all tasks to complete and handle exceptions
-            for future in as_completed(futures):
-                link = futures[future]
-                try:
-                    future.result()
-                except Exception as e:
-                    print_error(f"Error processing meshes for link '{link}': {e}")
-                    if raise_on_error:
-                        raise
+        print_debug("Processing meshes with %s parallel workers...", max_workers)
+        # Copying, dedup and bookkeeping stay on threads; the CPU-bound tools
+        # (pymeshlab decimation, collision hulls) are handed to worker
+        # processes so they run on separate cores. Inertia alone is too light
+        # to pay for starting them; it uses the pool only if one is running.
+        needs_pool = (
+            SIMPLIFY_MESH_TOOL_AVAILABLE and (simplify_meshes or simplify_collision_meshes)
+        ) or (generate_collision and GENERATE_COLLISION_AVAILABLE)
+        if needs_pool:
+            mesh_pool = _mesh_process_pool(max_workers)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Submit all link processing tasks
+                futures = {
+                    executor.submit(_process_link_mesh, link, mesh_path): link
+                    for link, mesh_path in absolute_mesh_paths.items()
+                }
+
+                # Wait for all tasks to complete and handle exceptions
+                for future in as_completed(futures):
+                    link = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print_error(f"Error processing meshes for link '{link}': {e}")
+                        if raise_on_error:
+                            raise
+        finally:
+            if mesh_pool is not None:
+                mesh_pool.shutdown(cancel_futures=True)
     else:
         # Sequential processing (fallback for single link or max_workers=1)
         for link, mesh_path in absolute_mesh_paths.items():
             _process_link_mesh(link, mesh_path)
 
-    total_processed = copied_count + converted_count + ignored_count + deduplicated_count
+    # Save what produced each output for the next run; write-then-rename so an
+    # interrupted run never leaves a half-written cache behind.
+    try:
+        tmp_cache_path = f"{_cache_path}.{os.getpid()}.tmp"
+        with open(tmp_cache_path, "w") as f:
+            json.dump(_records, f)
+        os.replace(tmp_cache_path, _cache_path)
+    except OSError as e:
+        print_debug("Could not write mesh cache '%s': %s", _cache_path, e)
+
+    copied_count = _counts["copied"]
+    converted_count = _counts["converted"]
+    ignored_count = _counts["ignored"]
+    deduplicated_count = _counts["deduplicated"]
+    unchanged_count = _counts["unchanged"]
+    total_processed = sum(_counts.values())
     summary_parts = []
     if copied_count > 0:
         summary_parts.append(f"{copied_count} copied")
@@ -965,6 +1495,8 @@ def copy_mesh_files(
         summary_parts.append(f"{converted_count} converted (DAE→STL)")
     if deduplicated_count > 0:
         summary_parts.append(f"{deduplicated_count} deduplicated (identical content)")
+    if unchanged_count > 0:
+        summary_parts.append(f"{unchanged_count} unchanged since last run")
     if ignored_count > 0:
         summary_parts.append(f"{ignored_count} ignored")
     if summary_parts:
@@ -987,6 +1519,8 @@ def copy_mesh_files(
             n_simplified = _simplify_counts[f"{mesh_type}_simplified"]
             n_skipped = _simplify_counts[f"{mesh_type}_skipped"]
             total_checked = n_simplified + n_skipped
+            if total_checked == 0:
+                continue  # every mesh was reused from the previous run
             if n_simplified > 0:
                 print_confirm(
                     f"-> {mesh_type.capitalize()} mesh simplification: "
@@ -994,8 +1528,9 @@ def copy_mesh_files(
                 )
             else:
                 print_info(
-                    f"-> {mesh_type.capitalize()} mesh simplification: "
-                    f"0/{total_checked} simplified — all meshes already below target face count"
+                    "-> %s mesh simplification: 0/%s simplified — all meshes already below target face count",
+                    mesh_type.capitalize(),
+                    total_checked,
                 )
 
     return material_info, inertia_data
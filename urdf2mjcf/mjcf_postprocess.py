@@ -11,13 +11,45 @@ from _utils import (
     print_confirm,
 )
 
+def post_process_joint_and_body_attributes(
+	root, damping_multiplier=None, armature=None, gravity_compensation=False
+):
+	"""Apply the per-joint and per-body tweaks in a single walk over the tree.
+
+	Joint damping is scaled everywhere (including <default> joints), while
+	armature and gravcomp only touch joints and bodies under <worldbody>.
+	"""
+	if armature is not None:
+		armature = str(armature)
+	if damping_multiplier is None and armature is None and not gravity_compensation:
+		return
+
+	n_joints = 0
+	n_bodies = 0
+	for child in root:
+		in_worldbody = child.tag == "worldbody"
+		for elem in child.iter():
+			if elem.tag == "joint":
+				if damping_multiplier is not None and "damping" in elem.attrib:
+					original_damping = float(elem.get("damping"))
+					elem.set("damping", str(original_damping * damping_multiplier))
+				if in_worldbody and armature is not None:
+					elem.set("armature", armature)
+					n_joints += 1
+			elif elem.tag == "body" and in_worldbody and gravity_compensation:
+				elem.set("gravcomp", "1")
+				n_bodies += 1
+
+	if damping_multiplier is not None:
+		print_debug("-> Multiplied joint damping by a factor of %s.", damping_multiplier)
+	if armature is not None:
+		print_debug("-> Set armature to '%s' for %s joints.", armature, n_joints)
+	if gravity_compensation:
+		print_debug("-> Enabled gravity compensation for %s bodies.", n_bodies)
+
 def post_process_damping_multiplier(root, damping_multiplier):
 	"""Multiply all joint damping by a factor to stabilize simulation for some robots."""
-	for joint in root.findall(".//joint"):
-		if "damping" in joint.attrib:
-			original_damping = float(joint.get("damping"))
-			joint.set("damping", str(original_damping * damping_multiplier))
-		print_debug(f"-> Multiplied joint damping by a factor of {damping_multiplier}.")
+	post_process_joint_and_body_attributes(root, damping_multiplier=damping_multiplier)
 
 def post_process_set_default_joint_properties(
 	root, stiffness=None, damping=None, friction=None
@@ -53,7 +85,7 @@ def post_process_set_default_joint_properties(
 		joint_node.set(name, value)
 
 	attrs = ", ".join(f"{name}='{value}'" for name, value in properties.items())
-	print_debug(f"-> Set default joint properties: {attrs}")
+	print_debug("-> Set default joint properties: %s", attrs)
 
 def post_process_compiler_options(root):
 	"""Apply compiler options captured from URDF into final MJCF."""
@@ -72,7 +104,7 @@ def post_process_compiler_options(root):
 	attrs_to_copy = compiler_node.attrib
 	for key, value in attrs_to_copy.items():
 		final_compiler_node.set(key, value)
-	print_debug(f"-> Applied post-processing to <compiler> tag with attributes: {attrs_to_copy}")
+	print_debug("-> Applied post-processing to <compiler> tag with attributes: %s", attrs_to_copy)
 
 def _parse_attr_string(attr_str, separator=" "):
 	"""Parse attribute string with given separator into a dictionary.
@@ -230,9 +262,9 @@ def _apply_custom_operations(target_node, operations):
 				old_value = target_node.get(attr_name)
 				target_node.set(attr_name, attr_value)
 				if old_value:
-					print_debug(f"Injected attribute {attr_name}='{attr_value}' (overwrote '{old_value}') into <{target_node.tag}>")
+					print_debug("Injected attribute %s='%s' (overwrote '%s') into <%s>", attr_name, attr_value, old_value, target_node.tag)
 				else:
-					print_debug(f"Injected attribute {attr_name}='{attr_value}' into <{target_node.tag}>")
+					print_debug("Injected attribute %s='%s' into <%s>", attr_name, attr_value, target_node.tag)
 		
 		elif operation_type == "replace":
 			# Only replace if attribute already exists
@@ -240,7 +272,7 @@ def _apply_custom_operations(target_node, operations):
 				if target_node.get(attr_name) is not None:
 					old_value = target_node.get(attr_name)
 					target_node.set(attr_name, attr_value)
-					print_debug(f"Replaced attribute {attr_name}='{old_value}' with '{attr_value}' in <{target_node.tag}>")
+					print_debug("Replaced attribute %s='%s' with '%s' in <%s>", attr_name, old_value, attr_value, target_node.tag)
 				else:
 					print_warning(f"Cannot replace non-existent attribute '{attr_name}' in <{target_node.tag}>. Use inject_attr(s) to add new attributes.")
 		
@@ -278,13 +310,13 @@ def _apply_custom_operations(target_node, operations):
 					else:
 						replacement_info.append(f"set {repl_key}='{repl_value}'")
 				
-				print_debug(f"Conditional replacement applied to <{target_node.tag}>: {', '.join(replacement_info)}")
+				print_debug("Conditional replacement applied to <%s>: %s", target_node.tag, ', '.join(replacement_info))
 			else:
-				print_debug(f"Conditional replacement conditions not met for <{target_node.tag}>")
+				print_debug("Conditional replacement conditions not met for <%s>", target_node.tag)
 	
 	# Log final result
 	target_attrs_str = ", ".join([f"{k}='{v}'" for k, v in target_node.attrib.items()])
-	print_debug(f"Applied custom operations to element: <{target_node.tag} {target_attrs_str}>")
+	print_debug("Applied custom operations to element: <%s %s>", target_node.tag, target_attrs_str)
 
 def post_process_inject_custom_mujoco_elements(root, elements):
 	"""Inject elements from URDF <mujoco> into MJCF.
@@ -294,7 +326,7 @@ def post_process_inject_custom_mujoco_elements(root, elements):
 		return
 
 	elements_str = "\n" + "\n".join([ET.tostring(elem, encoding="unicode") for elem in elements])
-	print_debug(f"-> Injecting custom MJCF elements from URDF: {elements_str}")
+	print_debug("-> Injecting custom MJCF elements from URDF: %s", elements_str)
 	
 	def _process_element_recursively(elem, parent_context=None):
 		"""Process an element and its children recursively."""
@@ -305,14 +337,14 @@ def post_process_inject_custom_mujoco_elements(root, elements):
 		elem_attrs_str = ", ".join([f"{k}='{v}'" for k, v in elem.attrib.items()])
 		if custom_operations:
 			ops_str = ", ".join([f"{op[0]}" for op in custom_operations])
-			print_debug(f"Processing <{elem.tag} {elem_attrs_str}> with operations: [{ops_str}]")
+			print_debug("Processing <%s %s> with operations: [%s]", elem.tag, elem_attrs_str, ops_str)
 		
 		# Handle inject_children operation specially
 		inject_children_op = next((op for op in custom_operations if op[0] == "inject_children"), None)
 		if inject_children_op:
 			_, match_attrs = inject_children_op
 			
-			print_debug(f"Found inject_children operation with match attributes: {match_attrs}")
+			print_debug("Found inject_children operation with match attributes: %s", match_attrs)
 			
 			# Find all matching elements in the MJCF that match the specified attributes
 			# We need to search for elements with the same tag as elem and matching attributes
@@ -324,12 +356,12 @@ def post_process_inject_custom_mujoco_elements(root, elements):
 				xpath_parts.append(f"[@{attr_name}='{attr_value}']")
 			xpath_query = "".join(xpath_parts)
 			
-			print_debug(f"Searching with XPath: {xpath_query}")
+			print_debug("Searching with XPath: %s", xpath_query)
 			
 			# Search for matching elements
 			matching_targets = search_context.findall(f".//{xpath_query}")
 			
-			print_debug(f"Found {len(matching_targets)} matching target(s)")
+			print_debug("Found %s matching target(s)", len(matching_targets))
 			
 			if matching_targets:
 				# Inject all children of this element into each matching target
@@ -337,7 +369,7 @@ def post_process_inject_custom_mujoco_elements(root, elements):
 				
 				for target_node in matching_targets:
 					target_attrs_str = ", ".join([f"{k}='{v}'" for k, v in target_node.attrib.items()])
-					print_debug(f"Injecting {len(children_to_inject)} child element(s) into <{target_node.tag} {target_attrs_str}>")
+					print_debug("Injecting %s child element(s) into <%s %s>", len(children_to_inject), target_node.tag, target_attrs_str)
 					
 					for child in children_to_inject:
 						child_copy = copy.deepcopy(child)
@@ -347,7 +379,7 @@ def post_process_inject_custom_mujoco_elements(root, elements):
 						_apply_inline_directives(child_copy)
 						target_node.append(child_copy)
 						child_attrs_str = ", ".join([f"{k}='{v}'" for k, v in child_copy.attrib.items()])
-						print_debug(f"  -> Injected <{child_copy.tag} {child_attrs_str}> into matching <{target_node.tag}>")
+						print_debug("  -> Injected <%s %s> into matching <%s>", child_copy.tag, child_attrs_str, target_node.tag)
 			else:
 				match_attrs_str = ", ".join([f"{k}='{v}'" for k, v in match_attrs.items()])
 				context_desc = f"within {parent_context.tag}" if parent_context is not None else "globally"
@@ -409,7 +441,7 @@ def post_process_inject_custom_mujoco_elements(root, elements):
 							# Regular child injection - copy the child as-is into the parent
 							child_copy = copy.deepcopy(child)
 							parent_node.append(child_copy)
-							print_debug(f"Injected regular child <{child_copy.tag}> into existing <{parent_node.tag}>.")
+							print_debug("Injected regular child <%s> into existing <%s>.", child_copy.tag, parent_node.tag)
 			else:
 				attrs_str = ", ".join([f"{k}='{v}'" for k, v in elem.attrib.items()])
 				print_warning(f"No matching parent element found for <{elem.tag} {attrs_str}> - cannot apply child operations")
@@ -432,13 +464,13 @@ def post_process_inject_custom_mujoco_elements(root, elements):
 			for target_node in exact_matches:
 				attrs_str = ", ".join([f"{k}='{v}'" for k, v in elem.attrib.items()])
 				target_attrs_str = ", ".join([f"{k}='{v}'" for k, v in target_node.attrib.items()])
-				print_info(f"Injecting children into exact matching element: <{target_node.tag} {target_attrs_str}>")
+				print_info("Injecting children into exact matching element: <%s %s>", target_node.tag, target_attrs_str)
 				
 				# Copy children from the injected element to the target
 				for child in elem:
 					child_copy = copy.deepcopy(child)
 					target_node.append(child_copy)
-					print_debug(f"Injected <{child_copy.tag}> into existing <{target_node.tag}>.")
+					print_debug("Injected <%s> into existing <%s>.", child_copy.tag, target_node.tag)
 			return
 
 		# No exact match found, create new element instance
@@ -454,7 +486,7 @@ def post_process_inject_custom_mujoco_elements(root, elements):
 			root.append(elem_copy)
 		
 		attrs_str = ", ".join([f"{k}='{v}'" for k, v in elem.attrib.items()])
-		print_debug(f"Added new <{elem.tag} {attrs_str}> instance to MJCF.")
+		print_debug("Added new <%s %s> instance to MJCF.", elem.tag, attrs_str)
 	
 	# Process all root-level elements
 	for elem in elements:
@@ -487,9 +519,9 @@ def post_process_transform_and_add_custom_plugin(root, urdf_plugin_node):
 		has_params = True
 
 	if has_params:
-		print_debug(f"-> Transformed and added custom plugin '{plugin_name}' with parameters.")
+		print_debug("-> Transformed and added custom plugin '%s' with parameters.", plugin_name)
 	else:
-		print_debug(f"-> Transformed and added custom plugin '{plugin_name}'.")
+		print_debug("-> Transformed and added custom plugin '%s'.", plugin_name)
 
 def post_process_add_floor(root):
 	"""Add a floor plane."""
@@ -619,23 +651,18 @@ def post_process_group_ros_utils_plugins(root):
 	extension_node = root.find("extension")
 	if extension_node is None:
 		return
-	# Collect existing MujocoRosUtils plugins
+	# Partition the children in one pass and move the MujocoRosUtils plugins
+	# to the end, rather than removing them one by one (O(n) each).
 	plugins = []
-	for p in list(extension_node.findall("plugin")):
-		pname = p.get("plugin") or ""
-		if pname.startswith("MujocoRosUtils::"):
-			plugins.append(p)
+	others = []
+	for child in extension_node:
+		if child.tag == "plugin" and (child.get("plugin") or "").startswith("MujocoRosUtils::"):
+			plugins.append(child)
+		else:
+			others.append(child)
 	if not plugins:
 		return
-	# Remove them from current positions
-	for p in plugins:
-		try:
-			extension_node.remove(p)
-		except ValueError:
-			pass
-	# Append grouped with comments
-	for p in plugins:
-		extension_node.append(p)
+	extension_node[:] = others + plugins
 
 
 def post_process_set_base_height(root, height_above_ground):
@@ -660,10 +687,7 @@ def post_process_set_base_height(root, height_above_ground):
 
 	pos[2] = str(height_above_ground)
 	base_body.set("pos", " ".join(pos))
-	print_debug(
-		f"-> Set base link '{base_body.get('name')}' height to "
-		f"{height_above_ground}."
-	)
+	print_debug("-> Set base link '%s' height to %s.", base_body.get('name'), height_above_ground)
 
 def post_process_make_base_floating(root, height_above_ground=0.0):
 	"""Add free joint to root body."""
@@ -678,29 +702,17 @@ def post_process_make_base_floating(root, height_above_ground=0.0):
 			if not has_free:
 				free_joint = ET.Element("freejoint", {})
 				base_body.insert(0, free_joint)
-				print_debug(
-					f"-> Made the base link '{base_body.get('name')}' floating with a free joint."
-				)
+				print_debug("-> Made the base link '%s' floating with a free joint.", base_body.get('name'))
 
 			post_process_set_base_height(root, height_above_ground)
 
 def post_process_add_gravity_compensation(root):
 	"""Set gravcomp=1 for bodies."""
-	worldbody = root.find("worldbody")
-	if worldbody is not None:
-		bodies = worldbody.findall(".//body")
-		for body in bodies:
-			body.set("gravcomp", "1")
-		print_debug(f"-> Enabled gravity compensation for {len(bodies)} bodies.")
+	post_process_joint_and_body_attributes(root, gravity_compensation=True)
 
 def post_process_set_joint_armature(root, armature_value):
 	"""Set 'armature' for all joints."""
-	worldbody = root.find("worldbody")
-	if worldbody is not None:
-		joints = worldbody.findall(".//joint")
-		for joint in joints:
-			joint.set("armature", str(armature_value))
-		print_debug(f"-> Set armature to '{armature_value}' for {len(joints)} joints.")
+	post_process_joint_and_body_attributes(root, armature=armature_value)
 
 def post_process_set_simulation_options(root, solver=None, integrator=None):
 	"""Set <option> solver/integrator."""
@@ -717,7 +729,7 @@ def post_process_set_simulation_options(root, solver=None, integrator=None):
 		option_node.set("integrator", integrator)
 		options_set.append(f"integrator='{integrator}'")
 	if options_set:
-		print_debug(f"-> Set simulation options: {', '.join(options_set)}")
+		print_debug("-> Set simulation options: %s", ', '.join(options_set))
 
 
 def post_process_add_actuators(root, default_ros2_control_instance, mimic_joints=None, add_ros_plugins=False, default_actuator_gains= {"kp" : 500.0, "kv" : 1.0}, ros2c_joint_map=None, force_actuator_tags=True, skip_mimic_actuators=False):
@@ -786,21 +798,19 @@ def post_process_add_actuators(root, default_ros2_control_instance, mimic_joints
 
 		is_mimic = mimic_joints and joint_name in mimic_joints
 		if is_mimic and skip_mimic_actuators:
-			print_debug(
-				f"-> Skipping actuator generation for equality-constrained mimic joint: {joint_name}"
-			)
+			print_debug("-> Skipping actuator generation for equality-constrained mimic joint: %s", joint_name)
 			continue
 
 		# Determine which actuator types to create from ros2_control interfaces
 		ifaces = set(ros2c_joint_map.get(joint_name, set()))
-		print_debug(f"-> Processing joint '{joint_name}' with ros2_control interfaces: {', '.join(ifaces) if ifaces else 'none'}")
+		print_debug("-> Processing joint '%s' with ros2_control interfaces: %s", joint_name, ', '.join(ifaces) if ifaces else 'none')
 		tags_to_add = []
 		if any(iface in ["position", "position_pid"] for iface in ifaces):
 			tags_to_add.append("position")
 		if any(iface in ["velocity", "velocity_pid"] for iface in ifaces):
 			tags_to_add.append("velocity")
 		if not tags_to_add:
-			print_debug(f"-> No supported ros2_control interfaces found for joint: {joint_name}; skipping actuator creation.")
+			print_debug("-> No supported ros2_control interfaces found for joint: %s; skipping actuator creation.", joint_name)
 			continue
 
 		# Use unique actuator names if multiple interfaces per joint
@@ -820,7 +830,7 @@ def post_process_add_actuators(root, default_ros2_control_instance, mimic_joints
 				if key == "dampratio" and actuator_attrs.get("kv", 0) != 0:
 					actuator_attrs.pop("kv")
 				actuator_attrs[key] = str(default_actuator_gains[key])
-				print_debug(f"Setting actuator attribute '{key}' to '{default_actuator_gains[key]}' for actuator '{act_name}'")
+				print_debug("Setting actuator attribute '%s' to '%s' for actuator '%s'", key, default_actuator_gains[key], act_name)
 
 			# ctrlrange from joint range
 			if "range" in joint.attrib:
@@ -840,7 +850,7 @@ def post_process_add_actuators(root, default_ros2_control_instance, mimic_joints
 
 
 			ET.SubElement(actuator_node, tag, actuator_attrs)
-			print_debug(f"-> Added '{tag}' actuator for joint: {joint_name}")
+			print_debug("-> Added '%s' actuator for joint: %s", tag, joint_name)
 
 		joint_names.append(joint_name)
 
@@ -855,12 +865,12 @@ def post_process_add_actuators(root, default_ros2_control_instance, mimic_joints
 				},
 			)
 			plugin_joint_names.append(joint_name)
-			print_debug(f"-> Added ROS plugin actuators for joint: {joint_name}")
+			print_debug("-> Added ROS plugin actuators for joint: %s", joint_name)
 
 	if joint_names:
-		print_debug(f"-> Added actuators for joints: {', '.join(joint_names)}")
+		print_debug("-> Added actuators for joints: %s", ', '.join(joint_names))
 	if plugin_joint_names:
-		print_debug(f"-> Added ROS plugin actuators for joints: {', '.join(plugin_joint_names)}")
+		print_debug("-> Added ROS plugin actuators for joints: %s", ', '.join(plugin_joint_names))
 
 def post_process_add_mimic_equalities(root, mimic_joints):
 	"""Convert URDF mimic joints to native MuJoCo joint equalities."""
@@ -939,10 +949,7 @@ def post_process_add_mimic_equalities(root, mimic_joints):
 		added_joint_names.append(joint_name)
 
 	if added_joint_names:
-		print_debug(
-			f"-> Added native MuJoCo mimic equalities for joints: "
-			f"{', '.join(added_joint_names)}"
-		)
+		print_debug("-> Added native MuJoCo mimic equalities for joints: %s", ', '.join(added_joint_names))
 
 def post_process_add_mimic_plugins(root, mimic_joints, default_actuator_gains):
 	"""Add legacy MimicJoint plugins and a position actuator for each follower."""
@@ -1014,7 +1021,7 @@ def post_process_add_mimic_plugins(root, mimic_joints, default_actuator_gains):
 			ET.SubElement(actuator_node, "position", attr)
 			existing_actuator_names.add(candidate)
 			created_position_actuators.append(joint_name)
-			print_debug(f"-> Added 'position' actuator for mimic joint: '{joint_name}'.")
+			print_debug("-> Added 'position' actuator for mimic joint: '%s'.", joint_name)
 
 		# Add the MimicJoint plugin entry under <actuator>
 		plugin_node = ET.SubElement(
@@ -1044,9 +1051,9 @@ def post_process_add_mimic_plugins(root, mimic_joints, default_actuator_gains):
 		mimic_plugin_joint_names.append(joint_name)
 
 	if created_position_actuators:
-		print_debug(f"-> Created missing position actuators for mimic joints: {', '.join(created_position_actuators)}")
+		print_debug("-> Created missing position actuators for mimic joints: %s", ', '.join(created_position_actuators))
 	if mimic_plugin_joint_names:
-		print_debug(f"-> Added ROS mimic joint plugins for joints: {', '.join(mimic_plugin_joint_names)}")
+		print_debug("-> Added ROS mimic joint plugins for joints: %s", ', '.join(mimic_plugin_joint_names))
 
 def post_process_add_materials(root, material_info, mesh_dir="assets/"):
 	"""Add material definitions to MJCF based on extracted mesh material information.
@@ -1139,7 +1146,7 @@ def post_process_add_materials(root, material_info, mesh_dir="assets/"):
 					# Assign material to this geom
 					geom.set("material", mat_name)
 					geom_material_assignments += 1
-					print_debug(f"-> Assigned material '{mat_name}' (RGBA: {rgba}) to geom with mesh '{geom_mesh}' in link '{link_name}'")
+					print_debug("-> Assigned material '%s' (RGBA: %s) to geom with mesh '%s' in link '%s'", mat_name, rgba, geom_mesh, link_name)
 	
 	if material_count > 0:
 		print_confirm(f"-> Added {material_count} material definitions from DAE files")
@@ -1203,4 +1210,4 @@ def post_process_geom_groups(root):
 		else:
 			geom.set("group", "3")
 			n_collision += 1
-	print_info(f"-> Assigned {n_visual} visual geoms to group 2, {n_collision} collision geoms to group 3.")
+	print_info("-> Assigned %s visual geoms to group 2, %s collision geoms to group 3.", n_visual, n_collision)
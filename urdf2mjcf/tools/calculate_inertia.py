@@ -26,18 +26,20 @@ def calculate_inertia(mesh_path, mass, translation=None, orientation=None, scale
         mesh = trimesh.load_mesh(mesh_path, force="mesh")
 
         if scale != 1.0:
-            print_info(f"[calculate_inertia] Applying scaling factor of {scale}")
+            print_info("[calculate_inertia] Applying scaling factor of %s", scale)
             mesh.apply_scale(scale)
 
         # If the mesh is not watertight, it's not a closed volume,
         # so we can't calculate volume or inertia.
         if not mesh.is_watertight:
             print_info(
-                f"[calculate_inertia] Warning: Mesh '{mesh_path}' is not watertight. Trying to fix it."
+                "[calculate_inertia] Warning: Mesh '%s' is not watertight. Trying to fix it.",
+                mesh_path,
             )
             if not mesh.fill_holes():
                 print_info(
-                    f"[calculate_inertia] Warning: Could not make the mesh '{mesh_path}' watertight. Attempt to calculate inertia anyways."
+                    "[calculate_inertia] Warning: Could not make the mesh '%s' watertight. Attempt to calculate inertia anyways.",
+                    mesh_path,
                 )
                 # return None
 
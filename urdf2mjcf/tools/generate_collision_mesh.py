@@ -160,7 +160,8 @@ def process_mesh_convex_hull(mesh_path, outdirpath, num_points=5000, visualize=F
         print(f"Processing {os.path.basename(mesh_path)} with convex hull")
 
     try:
-        mesh = trimesh.load(mesh_path, force="mesh")
+        # Qhull only needs the vertex cloud, so skip trimesh's merge/cleanup pass
+        mesh = trimesh.load(mesh_path, force="mesh", process=False)
         # Compute convex hull from all vertices to guarantee the true maximal hull.
         # (Sampling-based approaches can miss extremal vertices in small triangles.)
         hull = mesh.convex_hull
@@ -1,7 +1,7 @@
 #! /usr/bin/env python3
 
 import os
-import pymeshlab as ml
+import sys
 import argparse
 from _utils import print_debug, print_error, print_warning, print_confirm
 
@@ -13,6 +13,7 @@ def simplify_mesh(
     target_faces=None,
     translate=None,
     scale_factor=None,
+    ms=None,
 ):
     """Simplifies a single mesh file.
 
@@ -23,8 +24,14 @@ def simplify_mesh(
         target_faces: Target number of faces (alternative to target_reduction)
         translate: Translation vector [x, y, z]
         scale_factor: Uniform scale factor
+        ms: Optional pymeshlab.MeshSet to reuse across calls; it is cleared
+            before loading. A fresh one is created when None.
+
+    Returns:
+        tuple: (faces_before, faces_after) triangle counts of the loaded mesh
+            and of the mesh written to output_file
     """
-    print_debug(f"Processing: {input_file}")
+    print_debug("Processing: %s", input_file)
     try:
         # Fast-path: when only a face-count cap is requested and the file is
         # already at the destination, we can check the face count cheaply
@@ -39,22 +46,31 @@ def simplify_mesh(
                 _current_faces = len(_preview.faces)
                 if _current_faces <= target_faces:
                     print_debug(
-                        f"Skipping '{input_file}': {_current_faces} faces <= target {target_faces} (no simplification needed)"
+                        "Skipping '%s': %s faces <= target %s (no simplification needed)",
+                        input_file,
+                        _current_faces,
+                        target_faces,
                     )
                     # If output differs from input we still need to copy
                     if os.path.abspath(input_file) != os.path.abspath(output_file):
                         import shutil
                         os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
                         shutil.copy2(input_file, output_file)
-                    return
+                    return _current_faces, _current_faces
             except Exception:
                 pass  # Fall through to full pymeshlab path on any error
 
-        ms = ml.MeshSet()
+        if ms is None:
+            # Imported here so the trimesh fast path never loads MeshLab
+            import pymeshlab
+
+            ms = pymeshlab.MeshSet()
+        else:
+            ms.clear()
         ms.load_new_mesh(input_file)
 
         if translate:
-            print_debug(f"Translating mesh by: {translate}")
+            print_debug("Translating mesh by: %s", translate)
             ms.apply_filter(
                 "compute_matrix_from_translation",
                 axisx=translate[0],
@@ -64,7 +80,7 @@ def simplify_mesh(
             )
 
         if scale_factor:
-            print_debug(f"Scaling mesh by factor: {scale_factor}")
+            print_debug("Scaling mesh by factor: %s", scale_factor)
             ms.apply_filter(
                 "compute_matrix_from_scaling_or_normalization",
                 axisx=scale_factor,
@@ -76,7 +92,7 @@ def simplify_mesh(
 
         # Determine simplification parameters
         current_faces = ms.current_mesh().face_number()
-        print_debug(f"Current mesh '{input_file}' has {current_faces} faces")
+        print_debug("Current mesh '%s' has %s faces", input_file, current_faces)
 
         if target_faces is not None and target_reduction is not None:
             # Both limits specified — stop at whichever is hit first (least aggressive).
@@ -87,29 +103,38 @@ def simplify_mesh(
             else:
                 target_percentage = effective_target / current_faces
             print_debug(
-                f"Both limits active — target_faces={target_faces}, "
-                f"reduction={target_reduction} → {faces_from_reduction} faces; "
-                f"using first-hit target: {effective_target} faces "
-                f"(keeping {target_percentage * 100:.1f}%)"
+                "Both limits active — target_faces=%s, reduction=%s → %s faces; using first-hit target: %s faces (keeping %.1f%%)",
+                target_faces,
+                target_reduction,
+                faces_from_reduction,
+                effective_target,
+                target_percentage * 100,
             )
         elif target_faces is not None:
             # User specified target number of faces
             if target_faces >= current_faces:
                 print_debug(
-                    f"Target faces ({target_faces}) >= current faces ({current_faces}), skipping simplification"
+                    "Target faces (%s) >= current faces (%s), skipping simplification",
+                    target_faces,
+                    current_faces,
                 )
                 target_percentage = 1.0
             else:
                 target_percentage = target_faces / current_faces
                 print_debug(
-                    f"Simplifying mesh to {target_faces} faces (keeping {target_percentage * 100:.1f}% of faces)"
+                    "Simplifying mesh to %s faces (keeping %.1f%% of faces)",
+                    target_faces,
+                    target_percentage * 100,
                 )
         elif target_reduction is not None:
             # User specified reduction ratio (percentage to remove)
             target_percentage = 1.0 - target_reduction
             target_face_count = int(current_faces * target_percentage)
             print_debug(
-                f"Simplifying mesh with reduction: {target_reduction} (keeping {target_percentage * 100:.1f}%, target ~{target_face_count} faces)"
+                "Simplifying mesh with reduction: %s (keeping %.1f%%, target ~%s faces)",
+                target_reduction,
+                target_percentage * 100,
+                target_face_count,
             )
         else:
             # Default: no reduction
@@ -123,15 +148,15 @@ def simplify_mesh(
                 preservenormal=True,
             )
             final_faces = ms.current_mesh().face_number()
-            print_debug(f"Simplified mesh has {final_faces} faces")
+            print_debug("Simplified mesh has %s faces", final_faces)
         elif not needs_transform:
             # No simplification and no transforms applied — nothing changed.
-            print_debug(f"No changes needed for '{input_file}', skipping save")
+            print_debug("No changes needed for '%s', skipping save", input_file)
             if os.path.abspath(input_file) != os.path.abspath(output_file):
                 import shutil
                 os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
                 shutil.copy2(input_file, output_file)
-            return
+            return current_faces, current_faces
 
         # Ensure output directory exists
         output_dir = os.path.dirname(output_file)
@@ -139,14 +164,16 @@ def simplify_mesh(
             os.makedirs(output_dir, exist_ok=True)
 
         ms.save_current_mesh(output_file)
-        print_debug(f"Saved processed mesh to: {output_file}")
-    except ml.PyMeshLabException as e:
-        print_error(
-            f"PyMeshLab error processing {input_file}: {e}:\n{ml.print_filter_list()}"
-        )
-        raise
+        print_debug("Saved processed mesh to: %s", output_file)
+        return current_faces, ms.current_mesh().face_number()
     except Exception as e:
-        print_error(f"Failed to process {input_file}: {e}")
+        ml = sys.modules.get("pymeshlab")
+        if ml is not None and isinstance(e, ml.PyMeshLabException):
+            print_error(
+                f"PyMeshLab error processing {input_file}: {e}:\n{ml.print_filter_list()}"
+            )
+        else:
+            print_error(f"Failed to process {input_file}: {e}")
         raise
 
 
@@ -1,6 +1,7 @@
 import os
 import re
 import copy
+import functools
 import tempfile
 import numpy as np
 import xml.etree.ElementTree as ET
@@ -141,7 +142,11 @@ def zero_inertial_orientation(link_node):
 
         link_name = link_node.get("name", "unknown")
         print_debug(
-            f"   -> Zeroed inertial orientation for link '{link_name}' (was: {roll:.4f} {pitch:.4f} {yaw:.4f})"
+            "   -> Zeroed inertial orientation for link '%s' (was: %.4f %.4f %.4f)",
+            link_name,
+            roll,
+            pitch,
+            yaw,
         )
 
         return True
@@ -152,6 +157,24 @@ def zero_inertial_orientation(link_node):
         return False
 
 
+@functools.lru_cache(maxsize=256)
+def _package_share_directory(package_name, ament_prefix_path):
+    """Cached get_package_share_directory.
+
+    The ament index is searched on disk for every lookup, and mesh paths hit
+    the same few packages over and over. ament_prefix_path is only part of the
+    cache key so a changed AMENT_PREFIX_PATH is not served stale results.
+    Misses raise PackageNotFoundError and are not cached.
+    """
+    return get_package_share_directory(package_name)
+
+
+def _find_package_share(package_name):
+    return _package_share_directory(
+        package_name, os.environ.get("AMENT_PREFIX_PATH", "")
+    )
+
+
 def resolve_path(path):
     """
     Resolve a path that can be a package URI, a file URI, a relative path, or an absolute path.
@@ -168,10 +191,12 @@ def resolve_path(path):
             package_name = find_match.group(1)
             relative_path = find_match.group(2).lstrip("/")
             print_info(
-                f"Resolving for package '{package_name}' with relative path '{relative_path}'"
+                "Resolving for package '%s' with relative path '%s'",
+                package_name,
+                relative_path,
             )
             try:
-                pkg_share = get_package_share_directory(package_name)
+                pkg_share = _find_package_share(package_name)
                 return os.path.abspath(os.path.join(pkg_share, relative_path))
             except PackageNotFoundError:
                 context_msg = f" in {context}" if context else ""
@@ -191,7 +216,7 @@ def resolve_path(path):
             env_value = os.environ.get(var_name)
             if env_value is not None:
                 print_debug(
-                    f"Resolved environment variable '{var_name}' to '{env_value}'"
+                    "Resolved environment variable '%s' to '%s'", var_name, env_value
                 )
                 return env_value
             else:
@@ -212,7 +237,7 @@ def resolve_path(path):
         package_name = parts[0]
         relative_path = parts[1] if len(parts) > 1 else ""
         try:
-            pkg_share = get_package_share_directory(package_name)
+            pkg_share = _find_package_share(package_name)
             return os.path.abspath(os.path.join(pkg_share, relative_path))
         except PackageNotFoundError:
             print_warning(f"Could not resolve package '{package_name}'")
@@ -296,7 +321,10 @@ def preprocess_urdf(
     collision_subdir=None,
     dae_up_axis="auto",
 ):
-    """Pre-process URDF for MuJoCo compatibility."""
+    """Pre-process URDF for MuJoCo compatibility.
+
+    urdf_path may also be a binary file object (e.g. captured xacro output).
+    """
     print_debug("Pre-processing URDF...")
     urdf_tree = ET.parse(urdf_path)
     root = urdf_tree.getroot()
@@ -343,7 +371,9 @@ def preprocess_urdf(
                     try:
                         link_properties[link_name]["mass"] = float(mass_value)
                         print_debug(
-                            f"   -> Found mass for link '{link_name}': {mass_value} kg"
+                            "   -> Found mass for link '%s': %s kg",
+                            link_name,
+                            mass_value,
                         )
                     except ValueError:
                         print_warning(
@@ -388,7 +418,9 @@ def preprocess_urdf(
             # Check if it's a DAE file that needs expansion
             if file_ext == ".dae" and EXTRACT_DAE_AVAILABLE:
                 print_info(
-                    f"Expanding DAE file '{base_name}' for link '{link_name}' into multiple visual elements..."
+                    "Expanding DAE file '%s' for link '%s' into multiple visual elements...",
+                    base_name,
+                    link_name,
                 )
 
                 try:
@@ -479,11 +511,14 @@ def preprocess_urdf(
                                 color_elem.set("rgba", rgba_str)
 
                                 print_debug(
-                                    f"   -> Added visual '{mesh_name}' with material (RGBA: {rgba_str})"
+                                    "   -> Added visual '%s' with material (RGBA: %s)",
+                                    mesh_name,
+                                    rgba_str,
                                 )
                             else:
                                 print_debug(
-                                    f"   -> Added visual '{mesh_name}' (no material info)"
+                                    "   -> Added visual '%s' (no material info)",
+                                    mesh_name,
                                 )
 
                             # Insert the new visual element
@@ -587,7 +622,9 @@ def preprocess_urdf(
                 candidate = os.path.join(src_dir, collision_subdir, src_base)
                 if os.path.isfile(candidate):
                     print_debug(
-                        f"collision_subdir: using '{candidate}' instead of '{src_path}'"
+                        "collision_subdir: using '%s' instead of '%s'",
+                        candidate,
+                        src_path,
                     )
                     src_path = candidate
                 else:
@@ -597,7 +634,9 @@ def preprocess_urdf(
                         candidate = os.path.join(src_dir, collision_subdir, stem + variant_ext)
                         if os.path.isfile(candidate):
                             print_debug(
-                                f"collision_subdir: using '{candidate}' (case variant) instead of '{src_path}'"
+                                "collision_subdir: using '%s' (case variant) instead of '%s'",
+                                candidate,
+                                src_path,
                             )
                             src_path = candidate
                             break
@@ -738,7 +777,7 @@ def preprocess_urdf(
 
     if all_mujoco_nodes:
         print_debug(
-            f"-> Found {len(all_mujoco_nodes)} <mujoco> tags in URDF. Merging them."
+            "-> Found %s <mujoco> tags in URDF. Merging them.", len(all_mujoco_nodes)
         )
         # Merge all mujoco nodes recursively
         mujoco_node = _merge_nodes_recursively(all_mujoco_nodes)
@@ -776,12 +815,14 @@ def preprocess_urdf(
     if custom_mujoco_elements:
         tags = [e.tag for e in custom_mujoco_elements]
         print_debug(
-            f"-> Found {len(custom_mujoco_elements)} custom MuJoCo elements to inject: {', '.join(tags)}"
+            "-> Found %s custom MuJoCo elements to inject: %s",
+            len(custom_mujoco_elements),
+            ', '.join(tags),
         )
         # Debug: show each element's attributes
         for i, elem in enumerate(custom_mujoco_elements):
             attrs_str = ", ".join([f"{k}='{v}'" for k, v in elem.attrib.items()])
-            print_debug(f"   Element {i + 1}: <{elem.tag} {attrs_str}>")
+            print_debug("   Element %s: <%s %s>", i + 1, elem.tag, attrs_str)
 
     final_compiler_attrs = {
         "meshdir": default_mesh_dir,
@@ -809,7 +850,7 @@ def preprocess_urdf(
     for key, value in final_compiler_attrs.items():
         compiler_node.set(key, value)
 
-    print_debug(f"-> Set <compiler> tag attributes to: {final_compiler_attrs}")
+    print_debug("-> Set <compiler> tag attributes to: %s", final_compiler_attrs)
 
     ###########################
     # Process mimic joints
@@ -829,7 +870,7 @@ def preprocess_urdf(
                     "offset": offset,
                 }
     if mimic_joints:
-        print_debug(f"-> Found mimic joints: {', '.join(mimic_joints.keys())}")
+        print_debug("-> Found mimic joints: %s", ', '.join(mimic_joints.keys()))
 
     ###########################
     # Process ros2 control tags
@@ -851,7 +892,7 @@ def preprocess_urdf(
     if ros2c_joint_map:
         for jname, ifaces in ros2c_joint_map.items():
             print_debug(
-                f"-> Joint '{jname}' has command interfaces: {', '.join(ifaces)}"
+                "-> Joint '%s' has command interfaces: %s", jname, ', '.join(ifaces)
             )
 
     return (
@@ -1,5 +1,7 @@
 import fnmatch
+import os
 import xml.etree.ElementTree as ET
+import _utils
 from _utils import print_debug, print_info, print_warning
 
 def ensure_extension_node(root):
@@ -23,6 +25,38 @@ def ensure_extension_node(root):
 		root.append(extension_node)
 	return extension_node
 
+def write_tree_atomic(tree, path, encoding="utf-8", **kwargs):
+	"""Write an ElementTree through a 1 MiB buffer and rename it into place.
+
+	Readers never see a partially written file, and ElementTree's many small
+	writes are batched into few syscalls. Extra kwargs go to tree.write().
+	"""
+	tmp_path = f"{path}.{os.getpid()}.tmp"
+	try:
+		if encoding == "unicode":
+			f = open(tmp_path, "w", encoding="utf-8", buffering=1 << 20)
+		else:
+			f = open(tmp_path, "wb", buffering=1 << 20)
+		with f:
+			tree.write(f, encoding=encoding, **kwargs)
+		os.replace(tmp_path, path)
+	except BaseException:
+		if os.path.exists(tmp_path):
+			os.remove(tmp_path)
+		raise
+
+def write_text_atomic(text, path):
+	"""Write an already serialized document and rename it into place."""
+	tmp_path = f"{path}.{os.getpid()}.tmp"
+	try:
+		with open(tmp_path, "w", encoding="utf-8") as f:
+			f.write(text)
+		os.replace(tmp_path, path)
+	except BaseException:
+		if os.path.exists(tmp_path):
+			os.remove(tmp_path)
+		raise
+
 def ensure_child_after(root, child_tag, after_tag):
 	"""Ensure child_tag node exists and is placed after after_tag if present, else at start."""
 	node = root.find(child_tag)
@@ -81,12 +115,14 @@ def find_matching_elements_with_wildcards(root, elem):
 		if matches_all:
 			matching_nodes.append(candidate)
 			# Log the successful match with more detail
-			candidate_attrs = ", ".join([f"{k}='{v}'" for k, v in candidate.attrib.items()])
-			pattern_attrs = ", ".join([f"{k}='{v}'" for k, v in target_attrs.items()])
-			print_debug(f"Matched pattern <{tag} {pattern_attrs}> with wildcard found: <{tag} {candidate_attrs}>")
+			if _utils.DEBUG_ENABLED:
+				candidate_attrs = ", ".join([f"{k}='{v}'" for k, v in candidate.attrib.items()])
+				pattern_attrs = ", ".join([f"{k}='{v}'" for k, v in target_attrs.items()])
+				print_debug("Matched pattern <%s %s> with wildcard found: <%s %s>", tag, pattern_attrs, tag, candidate_attrs)
 	
 	if matching_nodes:
-		print_debug(f"Found {len(matching_nodes)} matching elements for pattern <{tag} {', '.join([f'{k}={v}' for k, v in target_attrs.items()])}>")
+		if _utils.DEBUG_ENABLED:
+			print_debug("Found %s matching elements for pattern <%s %s>", len(matching_nodes), tag, ', '.join([f'{k}={v}' for k, v in target_attrs.items()]))
 	else:
 		pattern_attrs = ", ".join([f"{k}='{v}'" for k, v in target_attrs.items()])
 		print_warning(f"No matching elements found for pattern <{tag} {pattern_attrs}>")